@@ -0,0 +1,123 @@
+from dotenv import load_dotenv
+from flask import Flask, jsonify
+from .config import config_by_name
+from datetime import timedelta
+from flask_cors import CORS
+from flask_migrate import Migrate 
+import os
+import logging
+from logging.handlers import RotatingFileHandler
+
+migrate = Migrate()
+
+
+def create_app(config_class=None):
+    # Load environment variables from .env file
+    load_dotenv()  
+    
+    # Initialize Flask app
+    app = Flask(__name__)
+    
+    # Configure the app using the Config class (APP_CONFIG=sqlite for the local SQLite profile)
+    if config_class is None:
+        config_class = config_by_name[os.environ.get('APP_CONFIG', 'default')]
+    app.config.from_object(config_class)
+    
+
+    app.config.update(
+         
+        SESSION_COOKIE_SAMESITE='None',  # Changed from 'Lax' to 'None' for cross-origin
+        SESSION_COOKIE_SECURE=False,      # Set to True in production
+        SESSION_COOKIE_HTTPONLY=True,
+        SESSION_COOKIE_NAME='sessionId',  # Custom cookie name
+        SESSION_COOKIE_DOMAIN=None,       # Allow cross-domain cookies
+        DEBUG=True
+    )
+
+    app.config['DEBUG'] = True
+    app.logger.setLevel(logging.DEBUG)
+    
+    # Configure the SECRET_KEY for signing and securing cookies
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
+    
+    # Initialize session handling (backend chosen by SESSION_BACKEND)
+    from .session_store import init_session
+    init_session(app)
+
+    # Enable CORS
+    frontend_url = os.environ.get('FRONTEND_URL' )
+    
+    CORS(app, supports_credentials=True, resources={r"/*": {"origins": "http://127.0.0.1:3000"}})
+    '''
+    CORS(app, 
+         resources={
+             r"/*": {
+                 "origins": ["http://127.0.0.1:3000"],
+                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+                 "allow_headers": ["Content-Type", "Authorization"],
+                 "expose_headers": ["Set-Cookie", "Content-Range", "X-Content-Range"],
+                 "supports_credentials": True
+             }
+         },
+         supports_credentials=True)
+    '''
+    # Add response headers for every response
+    @app.after_request
+    def after_request(response):
+        origin = "http://127.0.0.1:3000"
+        response.headers.add('Access-Control-Allow-Origin', origin)
+        response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
+        response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+        response.headers.add('Access-Control-Allow-Credentials', 'true')
+        response.headers.add('Access-Control-Expose-Headers', 'Set-Cookie')
+        return response
+    # Initialize the database and migration tool
+    from .models import db
+    db.init_app(app)
+    migrate.init_app(app, db)
+
+    # Latency histograms, per-request SQL counts and the /metrics endpoint.
+    # Registered before the other request hooks so their time is included.
+    from .metrics import init_metrics
+    init_metrics(app, db)
+
+    # Read replica routing for GETs, SQLite pragmas, create_all for the SQLite profile
+    from .database import init_database
+    init_database(app, db)
+
+    # Profile cache for dashboard lookups, invalidated on User writes
+    from .models import User
+    from .profile_cache import profile_cache, register_invalidation_hooks
+    profile_cache.init_app(app)
+    register_invalidation_hooks(User)
+
+    # Password hashing runs in a process pool; a full queue answers 503
+    from .hashing import HashingBusy, password_hasher
+    password_hasher.init_app(app)
+
+    @app.errorhandler(HashingBusy)
+    def hashing_busy(error):
+        response = jsonify({"message": "Server is busy, please try again shortly"})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+
+    # Register blueprints
+    from app.auth import auth_bp
+    from app.admin import admin_bp
+    from app.booking import booking_bp, init_booking
+    from app.stats import stats_bp, init_stats
+     
+    app.register_blueprint(auth_bp, url_prefix='/auth')
+    app.register_blueprint(admin_bp, url_prefix='/admin')
+    app.register_blueprint(booking_bp, url_prefix='/bookings')
+    app.register_blueprint(stats_bp, url_prefix='/api')
+
+    # Background sweeper that expires unconfirmed booking holds
+    init_booking(app)
+
+    # `flask stats rebuild` recomputes the dashboard counters; the SQLite profile
+    # seeds them on first start
+    init_stats(app)
+    
+
+    return app
@@ -0,0 +1,173 @@
+from flask import Blueprint, request, jsonify, session, current_app
+from .models import db, Admin, QuoRegister
+from sqlalchemy.exc import IntegrityError
+from functools import wraps
+import msgspec
+from .stats import record_registration
+from .bulk import export_users, import_users, iter_csv_rows, iter_ndjson_rows
+from .schemas import AdminLoginRequest, CreateAdminRequest, QUO_REGISTER_COLUMNS, UsersPage, decode_body, json_response, quo_register_out
+from .pagination import CursorError, fetch_page, keyset_query, parse_limit, stream_response
+
+# Admin blueprint
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+# Admin login route
+@admin_bp.route('/login', methods=['POST'])
+def login():
+    try:
+        credentials = decode_body(AdminLoginRequest)
+    except msgspec.MsgspecError:
+        return jsonify({"message": "Missing credentials"}), 400
+
+    admin = Admin.query.filter_by(email=credentials.email).first()
+    if admin and admin.check_password(credentials.password):
+        if db.session.is_modified(admin):
+            db.session.commit()  # Persist a password hash upgraded during check_password
+        session['admin_id'] = admin.id
+        return jsonify({"message": "Login successful", "admin_id": admin.id})
+    else:
+        return jsonify({"message": "Invalid credentials"}), 401
+
+# Admin logout route
+@admin_bp.route('/logout', methods=['POST'])
+def logout():
+    session.pop('admin_id', None)
+    return jsonify({"message": "Logout successful"})
+
+# Create a new admin (Only Main Admin)
+@admin_bp.route('/create-admin', methods=['POST'])
+def create_admin():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    # Authorization is read from the database, never the profile cache: another
+    # worker's cached copy could still grant rights that were just revoked
+    current_admin = db.session.get(Admin, session['admin_id'])
+    if not current_admin or not current_admin.is_main_admin:
+        return jsonify({"message": "Only main admins can create new admins"}), 403
+
+    try:
+        data = decode_body(CreateAdminRequest)
+    except msgspec.ValidationError as e:
+        return jsonify({"message": f"Invalid request: {e}"}), 400
+    except msgspec.DecodeError:
+        return jsonify({"message": "Request body must be valid JSON"}), 400
+
+    new_admin = Admin(
+        username=data.username,
+        id_number=data.id_number,
+        email=data.email,
+        phone_number=data.phone_number,
+        is_main_admin=data.is_main_admin
+    )
+    new_admin.set_password(data.password)
+
+    db.session.add(new_admin)
+    db.session.commit()
+    return jsonify({"message": "Admin created successfully"})
+
+# Columns the registered users list can be ordered by; each is backed by a
+# composite (column, id) index so keyset pages stay cheap
+SORT_COLUMNS = {
+    'full_name': QuoRegister.full_name,
+    'registration_date': QuoRegister.registration_date,
+}
+
+def list_users(sort_by):
+    """
+    Lists registered users ordered by sort_by.
+
+    With ?limit= or ?cursor= a single keyset page is returned together with
+    next_cursor. Otherwise the whole table is streamed from a server-side
+    cursor, as a JSON array or as NDJSON when ?format=ndjson.
+    """
+    sort_column = SORT_COLUMNS[sort_by]
+    cursor = request.args.get('cursor')
+    raw_limit = request.args.get('limit')
+
+    try:
+        if cursor is not None or raw_limit is not None:
+            rows, next_cursor = fetch_page(
+                QuoRegister, sort_column, cursor, parse_limit(raw_limit), columns=QUO_REGISTER_COLUMNS
+            )
+            return json_response(UsersPage(users=[quo_register_out(row) for row in rows], next_cursor=next_cursor))
+        query = keyset_query(QuoRegister, sort_column, columns=QUO_REGISTER_COLUMNS)
+    except CursorError as e:
+        return jsonify({"message": str(e)}), 400
+
+    return stream_response(query, quo_register_out, request.args.get('format', 'json'), scalars=False)
+
+# View all registered users
+@admin_bp.route('/users', methods=['GET'])
+def get_users():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    return list_users('full_name')
+
+# Delete a user
+@admin_bp.route('/users/<int:user_id>', methods=['DELETE'])
+def delete_user(user_id):
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    user = QuoRegister.query.get(user_id)
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    db.session.delete(user)
+    record_registration(user, -1)  # Dashboard counters commit with the delete
+    db.session.commit()
+    return jsonify({"message": "User deleted successfully"})
+
+# Sort users (by name or registration date)
+@admin_bp.route('/users/sort', methods=['GET'])
+def sort_users():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    sort_by = request.args.get('sort_by', 'full_name')  # Default sorting by full_name
+    if sort_by not in SORT_COLUMNS:
+        return jsonify({"message": "Invalid sort option"}), 400
+
+    return list_users(sort_by)
+
+# Bulk import users from a CSV (with header row) or NDJSON upload
+@admin_bp.route('/users/import', methods=['POST'])
+def import_users_route():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    fmt = request.args.get('format')
+    if fmt is None:
+        fmt = 'ndjson' if request.mimetype in ('application/x-ndjson', 'application/json') else 'csv'
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({"message": "format must be csv or ndjson"}), 400
+
+    try:
+        batch_size = int(request.args.get('batch_size', current_app.config['BULK_IMPORT_BATCH_SIZE']))
+    except ValueError:
+        return jsonify({"message": "batch_size must be an integer"}), 400
+    if batch_size < 1 or batch_size > current_app.config['BULK_IMPORT_MAX_BATCH_SIZE']:
+        return jsonify({"message": f"batch_size must be between 1 and {current_app.config['BULK_IMPORT_MAX_BATCH_SIZE']}"}), 400
+
+    rows = iter_ndjson_rows(request.stream) if fmt == 'ndjson' else iter_csv_rows(request.stream)
+    try:
+        report = import_users(rows, batch_size, current_app.config['BULK_IMPORT_MAX_ERRORS'])
+    except UnicodeDecodeError:
+        db.session.rollback()
+        return jsonify({"message": "Upload must be UTF-8 encoded"}), 400
+
+    return jsonify(report.to_dict()), 200
+
+# Stream all users as CSV or NDJSON
+@admin_bp.route('/users/export', methods=['GET'])
+def export_users_route():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    fmt = request.args.get('format', 'csv')
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({"message": "format must be csv or ndjson"}), 400
+
+    return export_users(fmt)
@@ -0,0 +1,170 @@
+import re
+from flask import Blueprint, jsonify, session, current_app, redirect
+from app.models import User
+from datetime import timedelta
+from sqlalchemy.exc import IntegrityError
+from .models import db
+from .hashing import HashingBusy, password_hasher
+from .stats import record_user
+from .profile_cache import profile_cache, user_key
+from app.utils import validate_email
+from .schemas import Dashboard, LoginRequest, LoginResponse, RegisterRequest, decode_body, json_response, missing_fields
+import msgspec
+from functools import wraps
+import traceback
+ 
+
+auth_bp = Blueprint('auth', __name__)
+ 
+
+# Password validation function
+def validate_password(password):
+    if len(password) < 6:
+        return False
+    if not re.search(r'\d', password):  # Check for numbers
+        return False
+    if not re.search(r'[A-Za-z]', password):  # Check for letters
+        return False
+    if not re.search(r'[@$!%*?&]', password):  # Check for special characters
+        return False
+    return True
+
+def build_user_dashboard(user):
+    """
+    Builds the dashboard returned by login and /auth/dashboard.
+    """
+    return Dashboard(
+        id_number=user.id_number,
+        name=user.full_name,
+        email=user.email,
+        parish=user.parish,
+        registration_date=user.registration_date.strftime("%Y-%m-%d") if user.registration_date else None,
+        role=user.role.value
+    )
+
+def load_user_dashboard(id_number):
+    user = User.query.filter_by(id_number=id_number).first()
+    return build_user_dashboard(user) if user else None
+
+@auth_bp.route('/register', methods=['POST'])
+def register():
+    try:
+        # Decoding also checks that every required field is present and non-empty
+        try:
+            user_data = decode_body(RegisterRequest)
+        except msgspec.ValidationError as e:
+            missing = missing_fields(RegisterRequest)
+            if missing:
+                return jsonify({"error": "Missing required fields", "missing": missing}), 400
+            return jsonify({"error": "Invalid fields", "details": str(e)}), 400
+        except msgspec.DecodeError:
+            return jsonify({"error": "Request body must be valid JSON"}), 400
+
+        # Validate password and email
+        if not validate_email(user_data.email):
+            return jsonify({"error": "Invalid email format"}), 400
+        if not validate_password(user_data.password):
+            return jsonify({"error": "Password must be at least 6 characters long and contain letters, numbers, and special characters"}), 400
+
+        # Create new user
+        hashed_password = password_hasher.hash(user_data.password)
+        new_user = User(
+            id_number=user_data.id_number,
+            full_name=user_data.full_name,
+            email=user_data.email,
+            parish=user_data.parish,
+            user_password=hashed_password
+        )
+        db.session.add(new_user)
+        record_user(new_user)  # Dashboard counters commit with the user
+        db.session.commit()
+
+        return json_response({"message": "User registered successfully"}, 201)
+
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify({"error": f"Integrity error: {str(e)}"}), 400
+    except HashingBusy:
+        db.session.rollback()
+        raise
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Registration failed: {str(e)}"}), 500
+
+ 
+# Updated login endpoint
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    try:
+        try:
+            credentials = decode_body(LoginRequest)
+        except msgspec.MsgspecError:
+            return jsonify({"message": "Missing credentials"}), 400
+
+        user = User.query.filter_by(id_number=credentials.id_number).first()
+        if not user or not user.check_password(credentials.password):
+            return jsonify({"message": "Invalid credentials"}), 401
+        if db.session.is_modified(user):
+            db.session.commit()  # Persist a password hash upgraded during check_password
+
+        # Set session data
+        session['id_number'] = user.id_number
+        session['full_name'] = user.full_name
+        session['role'] = user.role.value  # Assuming role is an Enum or some attribute
+
+        # Set the session as permanent (lasts as long as PERMANENT_SESSION_LIFETIME)
+        session.permanent = True
+
+        # Create response with user dashboard data and prime the profile
+        # cache so the dashboard request that follows skips the database
+        user_dashboard = build_user_dashboard(user)
+        profile_cache.set(user_key(user.id_number), user_dashboard)
+
+        # The session interface sets the session cookie (SESSION_COOKIE_NAME) itself
+        return json_response(LoginResponse(message="Login successful", user_dashboard=user_dashboard))
+
+    except HashingBusy:
+        raise
+    except Exception as e:
+        current_app.logger.error(f"Login error: {str(e)}")
+        return jsonify({"message": "Login failed due to an error"}), 500
+
+# Simplified dashboard route without authentication check
+@auth_bp.route('/dashboard', methods=['GET'])
+def dashboard():
+    try:
+        # Retrieve id_number from session
+        id_number = session.get('id_number')
+        
+        if not id_number:
+            # If no session, return a default or initial dashboard state
+            return jsonify({
+                "message": "No active session",
+                "status": "unauthenticated"
+            }), 200
+
+        # Served from the profile cache; the database is only hit on a miss
+        user_dashboard = profile_cache.get_or_load(user_key(id_number), lambda: load_user_dashboard(id_number))
+        
+        if not user_dashboard:
+            return jsonify({
+                "message": "User not found",
+                "status": "unauthenticated"
+            }), 200
+
+        current_app.logger.info(f"Dashboard data retrieved for user {id_number}.")
+        return json_response(user_dashboard)
+
+    except Exception as e:
+        current_app.logger.error(f"Unexpected error in dashboard: {str(e)}")
+        return jsonify({"message": "An unexpected error occurred"}), 500
+# Logout route to clear the session
+@auth_bp.route('/logout', methods=['POST'])
+def logout():
+    try:
+        session.clear()  # Clear all session data
+        current_app.logger.info("User logged out successfully")
+        return jsonify({"message": "Logged out successfully"}), 200
+    except Exception as e:
+        current_app.logger.error(f"Error during logout: {str(e)}")
+        return jsonify({"message": "Error during logout", "details": str(e)}), 500
@@ -0,0 +1,201 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from flask import Blueprint, request, jsonify, session, current_app
+from sqlalchemy import select, update
+from .models import db, Booking, BookingStatus, Slot
+from .ttl_cache import Sweeper
+
+booking_bp = Blueprint('booking', __name__)
+
+
+class BookingError(Exception):
+    """
+    Raised when a reservation or confirmation cannot be made; carries the HTTP status to answer with.
+    """
+
+    def __init__(self, message, status_code=409):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def reserve(slot_id, id_number, hold_seconds):
+    """
+    Places a pending hold on one seat of a slot.
+
+    The seat is taken with a single conditional UPDATE (reserved < capacity),
+    so concurrent reservations serialise on the slot row in the database and
+    a slot can never be oversold.
+    """
+    taken = db.session.execute(
+        update(Slot)
+        .where(Slot.id == slot_id, Slot.reserved < Slot.capacity)
+        .values(reserved=Slot.reserved + 1)
+    ).rowcount
+    if taken != 1:
+        db.session.rollback()
+        if db.session.get(Slot, slot_id) is None:
+            raise BookingError("Slot not found", 404)
+        raise BookingError("Slot is fully booked")
+
+    booking = Booking(
+        slot_id=slot_id,
+        id_number=id_number,
+        status=BookingStatus.PENDING,
+        hold_expires_at=datetime.utcnow() + timedelta(seconds=hold_seconds)
+    )
+    db.session.add(booking)
+    db.session.commit()
+    return booking
+
+
+def confirm(booking_id, id_number):
+    """
+    Moves a booking from Pending to Confirmed if its hold has not run out.
+    """
+    now = datetime.utcnow()
+    confirmed = db.session.execute(
+        update(Booking)
+        .where(
+            Booking.id == booking_id,
+            Booking.id_number == id_number,
+            Booking.status == BookingStatus.PENDING,
+            Booking.hold_expires_at > now
+        )
+        .values(status=BookingStatus.CONFIRMED, confirmed_at=now)
+    ).rowcount
+    db.session.commit()
+
+    booking = db.session.get(Booking, booking_id)
+    if booking is None or booking.id_number != id_number:
+        raise BookingError("Booking not found", 404)
+    if not confirmed and booking.status != BookingStatus.CONFIRMED:
+        raise BookingError("Booking hold has expired")
+    return booking
+
+
+def expire_holds(batch_size=500):
+    """
+    Expires up to batch_size pending bookings whose hold has run out and frees their seats.
+
+    Each booking is flipped with its own conditional UPDATE so a hold confirmed
+    at the same moment is never released; seats are then returned with one
+    UPDATE per slot and the whole batch commits together.
+    """
+    now = datetime.utcnow()
+    candidates = db.session.execute(
+        select(Booking.id, Booking.slot_id)
+        .where(Booking.status == BookingStatus.PENDING, Booking.hold_expires_at <= now)
+        .order_by(Booking.hold_expires_at)
+        .limit(batch_size)
+    ).all()
+
+    released = Counter()
+    for booking_id, slot_id in candidates:
+        expired = db.session.execute(
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status == BookingStatus.PENDING)
+            .values(status=BookingStatus.EXPIRED)
+        ).rowcount
+        if expired:
+            released[slot_id] += 1
+
+    for slot_id, count in released.items():
+        db.session.execute(
+            update(Slot).where(Slot.id == slot_id).values(reserved=Slot.reserved - count)
+        )
+    db.session.commit()
+    return sum(released.values())
+
+
+class HoldSweeper:
+    """
+    Sweeper target that runs expire_holds inside an application context.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def sweep(self, batch_size):
+        with self.app.app_context():
+            try:
+                return expire_holds(batch_size)
+            finally:
+                db.session.remove()
+
+
+def init_booking(app):
+    if app.config['BOOKING_SWEEPER_ENABLED']:
+        app.extensions['booking_sweeper'] = Sweeper(
+            HoldSweeper(app),
+            interval=app.config['BOOKING_SWEEP_INTERVAL'],
+            batch_size=app.config['BOOKING_SWEEP_BATCH_SIZE'],
+            name='booking-hold-sweeper',
+        ).start()
+
+
+# List slots with their remaining availability
+@booking_bp.route('/slots', methods=['GET'])
+def list_slots():
+    slots = Slot.query.order_by(Slot.starts_at, Slot.id).all()
+    return jsonify([slot.to_dict() for slot in slots])
+
+# Create a slot (Admins only)
+@booking_bp.route('/slots', methods=['POST'])
+def create_slot():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    data = request.get_json() or {}
+    try:
+        capacity = int(data['capacity'])
+        starts_at = datetime.fromisoformat(data['starts_at'])
+        title = data['title']
+    except (KeyError, TypeError, ValueError):
+        return jsonify({"message": "title, starts_at (ISO 8601) and capacity are required"}), 400
+    if capacity < 1:
+        return jsonify({"message": "capacity must be at least 1"}), 400
+
+    slot = Slot(title=title, starts_at=starts_at, capacity=capacity, reserved=0)
+    db.session.add(slot)
+    db.session.commit()
+    return jsonify(slot.to_dict()), 201
+
+# Hold a seat on a slot for the logged-in user
+@booking_bp.route('', methods=['POST'])
+def create_booking():
+    id_number = session.get('id_number')
+    if not id_number:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    data = request.get_json() or {}
+    if not isinstance(data.get('slot_id'), int):
+        return jsonify({"message": "slot_id is required"}), 400
+
+    try:
+        booking = reserve(data['slot_id'], id_number, current_app.config['BOOKING_HOLD_SECONDS'])
+    except BookingError as e:
+        return jsonify({"message": str(e)}), e.status_code
+    return jsonify(booking.to_dict()), 201
+
+# Confirm a pending booking before its hold expires
+@booking_bp.route('/<int:booking_id>/confirm', methods=['POST'])
+def confirm_booking(booking_id):
+    id_number = session.get('id_number')
+    if not id_number:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    try:
+        booking = confirm(booking_id, id_number)
+    except BookingError as e:
+        return jsonify({"message": str(e)}), e.status_code
+    return jsonify(booking.to_dict())
+
+# List the logged-in user's bookings
+@booking_bp.route('', methods=['GET'])
+def my_bookings():
+    id_number = session.get('id_number')
+    if not id_number:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    bookings = Booking.query.filter_by(id_number=id_number).order_by(Booking.created_at.desc()).all()
+    return jsonify([booking.to_dict() for booking in bookings])
@@ -0,0 +1,204 @@
+import csv
+import io
+from datetime import datetime
+import msgspec
+from flask import Response, stream_with_context
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from .auth import validate_password
+from .hashing import password_hasher
+from .models import db, Role, User
+from .pagination import iter_chunks, iter_rows
+from .schemas import encoder, user_out
+from .stats import record_users
+from .utils import validate_email
+
+IMPORT_FIELDS = ['id_number', 'full_name', 'email', 'parish', 'password']
+EXPORT_FIELDS = ['id_number', 'full_name', 'email', 'parish', 'registration_date', 'role']
+
+# Export rows are written out in chunks of this many lines
+EXPORT_CHUNK_ROWS = 500
+
+
+class ImportReport:
+    """
+    Running totals and per-row errors for a bulk import.
+    """
+
+    def __init__(self, max_errors):
+        self.inserted = 0
+        self.failed = 0
+        self.max_errors = max_errors
+        self.errors = []
+
+    def fail(self, line, id_number, message):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "id_number": id_number, "error": message})
+
+    def to_dict(self):
+        return {
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors)
+        }
+
+
+def iter_csv_rows(stream):
+    """
+    Yields (line number, row dict) from a CSV upload with a header row, reading it incrementally.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8', newline=''))
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_ndjson_rows(stream):
+    """
+    Yields (line number, row dict or error message) from an NDJSON upload, one line at a time.
+    """
+    for line_num, line in enumerate(io.TextIOWrapper(stream, encoding='utf-8'), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = msgspec.json.decode(line)
+        except msgspec.DecodeError:
+            yield line_num, "Invalid JSON"
+            continue
+        yield line_num, row if isinstance(row, dict) else "Row must be a JSON object"
+
+
+def validate_row(row):
+    """
+    Applies the same checks as auth.register to one row. Returns (clean row, error message).
+    """
+    clean = {field: str(row.get(field) or '').strip() for field in IMPORT_FIELDS}
+    clean['password'] = str(row.get('password') or '')  # Hashed exactly as given, like auth.register
+    missing = [field for field in IMPORT_FIELDS if not clean[field]]
+    if missing:
+        return None, f"Missing required fields: {', '.join(missing)}"
+    if not validate_email(clean['email']):
+        return None, "Invalid email format"
+    if not validate_password(clean['password']):
+        return None, "Password must be at least 6 characters long and contain letters, numbers, and special characters"
+    return clean, None
+
+
+def _drop_duplicates(batch, report):
+    # Duplicates inside the batch and against rows already in the table are
+    # reported up front so the batch insert normally succeeds in one go
+    ids = {row['id_number'] for _, row in batch}
+    emails = {row['email'] for _, row in batch}
+    taken_ids = set(db.session.scalars(select(User.id_number).where(User.id_number.in_(ids))))
+    taken_emails = set(db.session.scalars(select(User.email).where(User.email.in_(emails))))
+
+    unique = []
+    for line, row in batch:
+        if row['id_number'] in taken_ids:
+            report.fail(line, row['id_number'], "id_number is already registered")
+        elif row['email'] in taken_emails:
+            report.fail(line, row['id_number'], "email is already registered")
+        else:
+            taken_ids.add(row['id_number'])
+            taken_emails.add(row['email'])
+            unique.append((line, row))
+    return unique
+
+
+def _insert_batch(batch, report):
+    batch = _drop_duplicates(batch, report)
+    if not batch:
+        return
+
+    hashes = password_hasher.hash_many([row['password'] for _, row in batch], wait=True)
+    now = datetime.utcnow()
+    rows = [
+        {
+            'id_number': row['id_number'],
+            'full_name': row['full_name'],
+            'email': row['email'],
+            'parish': row['parish'],
+            'user_password': pwhash,
+            'registration_date': now,
+            'role': Role.USER
+        }
+        for (_, row), pwhash in zip(batch, hashes)
+    ]
+
+    try:
+        with db.session.begin_nested():
+            db.session.execute(insert(User), rows)  # One executemany for the whole batch
+        inserted = rows
+    except IntegrityError:
+        # A concurrent writer took some keys; retry row by row to find them
+        inserted = []
+        for (line, _), row in zip(batch, rows):
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(User), [row])
+                inserted.append(row)
+            except IntegrityError as e:
+                report.fail(line, row['id_number'], f"Integrity error: {e.orig}")
+
+    record_users(inserted)
+    db.session.commit()
+    report.inserted += len(inserted)
+
+
+def import_users(rows, batch_size, max_errors=1000):
+    """
+    Validates, hashes and inserts users from an iterator of (line number, row) in batches.
+
+    Each batch commits on its own; bad rows are collected in the report
+    instead of aborting the import.
+    """
+    report = ImportReport(max_errors)
+    batch = []
+    for line, row in rows:
+        if isinstance(row, str):
+            report.fail(line, None, row)
+            continue
+        clean, error = validate_row(row)
+        if error:
+            report.fail(line, row.get('id_number'), error)
+            continue
+        batch.append((line, clean))
+        if len(batch) >= batch_size:
+            _insert_batch(batch, report)
+            batch = []
+    if batch:
+        _insert_batch(batch, report)
+    return report
+
+
+def _csv_body(users):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    for count, user in enumerate(users, start=1):
+        writer.writerow(user.to_dict())
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_body(users):
+    for chunk in iter_chunks(users, EXPORT_CHUNK_ROWS):
+        yield encoder.encode_lines([user_out(user) for user in chunk])
+
+
+def export_users(fmt='csv'):
+    """
+    Streams every user (without password hashes) from a server-side cursor as CSV or NDJSON.
+    """
+    users = iter_rows(select(User).order_by(User.id_number))
+    if fmt == 'ndjson':
+        body, mimetype, filename = _ndjson_body(users), 'application/x-ndjson', 'users.ndjson'
+    else:
+        body, mimetype, filename = _csv_body(users), 'text/csv', 'users.csv'
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
@@ -0,0 +1,112 @@
+import time
+from flask import g, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql import Select
+
+# Bind key of the optional read replica (SQLALCHEMY_BINDS['replica'])
+REPLICA = 'replica'
+
+# Session key holding the time until which this client's reads stay on the primary
+PRIMARY_UNTIL_KEY = '_primary_until'
+
+
+def _mark_write(db_session):
+    db_session.info['wrote'] = True
+    if has_request_context():
+        g.db_wrote = True
+
+
+class RoutingSession(Session):
+    """
+    Sends plain SELECTs to the read replica while the current request is marked read-only.
+
+    Everything else goes to the primary: writes, flushes, queries outside a
+    request (CLI, sweepers), and every query in a transaction that has
+    already written, so a request always reads its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and isinstance(clause, Select)
+            and not self._flushing
+            and not self.info.get('wrote')
+            and has_request_context()
+            and g.get('db_read_only')
+        ):
+            replica = self._db.engines.get(REPLICA)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def use_primary(view):
+    """
+    Marks a read-only view that must still read from the primary.
+    """
+    view.use_primary = True
+    return view
+
+
+def _after_flush(db_session, flush_context):
+    _mark_write(db_session)
+
+
+def _do_orm_execute(orm_execute_state):
+    if not orm_execute_state.is_select:
+        _mark_write(orm_execute_state.session)
+
+
+def _end_transaction(db_session, *args):
+    db_session.info.pop('wrote', None)
+
+
+def _sqlite_on_connect(dbapi_connection, connection_record):
+    # WAL lets readers run alongside the single writer; NORMAL sync is safe with WAL
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+
+def init_database(app, db):
+    """
+    Wires read/write routing and SQLite connection settings into the app.
+    """
+    for target, identifier, fn in [
+        (RoutingSession, 'after_flush', _after_flush),
+        (RoutingSession, 'do_orm_execute', _do_orm_execute),
+        (RoutingSession, 'after_commit', _end_transaction),
+        (RoutingSession, 'after_rollback', _end_transaction),
+    ]:
+        if not event.contains(target, identifier, fn):
+            event.listen(target, identifier, fn)
+
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == 'sqlite' and not event.contains(engine, 'connect', _sqlite_on_connect):
+                event.listen(engine, 'connect', _sqlite_on_connect)
+        has_replica = REPLICA in db.engines
+        if app.config.get('SQLALCHEMY_CREATE_ALL'):
+            db.create_all()
+
+    window = app.config['DB_READ_YOUR_WRITES_SECONDS']
+
+    @app.before_request
+    def route_reads():
+        # GETs read from the replica unless the view opts out or this client
+        # wrote recently and the replica may not have caught up yet
+        view = app.view_functions.get(request.endpoint)
+        g.db_read_only = (
+            has_replica
+            and request.method in ('GET', 'HEAD')
+            and not getattr(view, 'use_primary', False)
+            and session.get(PRIMARY_UNTIL_KEY, 0) < time.time()
+        )
+
+    @app.after_request
+    def remember_write(response):
+        if has_replica and g.get('db_wrote'):
+            session[PRIMARY_UNTIL_KEY] = time.time() + window
+        return response
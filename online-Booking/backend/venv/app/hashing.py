@@ -0,0 +1,191 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash, check_password_hash
+from .metrics import metrics
+
+
+class HashingBusy(Exception):
+    """
+    Raised when the hashing queue is full or a hash times out; callers should answer with a 503.
+    """
+
+
+def build_method(algorithm, cost=None):
+    """
+    Builds a werkzeug hashing method string, e.g. 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'.
+    """
+    if not cost:
+        return algorithm
+    if algorithm == 'scrypt':
+        return f'scrypt:{cost}:8:1'
+    if algorithm.startswith('pbkdf2'):
+        return f'{algorithm}:{cost}'
+    raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+
+
+def method_prefix(method):
+    """
+    Returns the prefix werkzeug writes before the salt for a method, e.g. 'scrypt' -> 'scrypt:32768:8:1'.
+
+    Mirrors werkzeug's defaults so needs_rehash() doesn't have to run the KDF
+    to find out. Returns None for methods it doesn't know.
+    """
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        n, r, p = args or (2 ** 15, 8, 1)
+        return f'scrypt:{n}:{r}:{p}'
+    if name == 'pbkdf2':
+        hash_name = args[0] if args else 'sha256'
+        iterations = args[1] if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+    return None
+
+
+def _pool_context():
+    # Forking a threaded server (sweepers, connection pool, logging) can copy a
+    # held lock into the child and deadlock it; forkserver forks from a clean
+    # single-threaded process instead. Windows only has spawn.
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['werkzeug.security'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+class PasswordHasher:
+    """
+    Runs the password KDF in a bounded process pool so it never blocks request threads.
+
+    At most queue_size hashes may be queued or running at once; beyond that
+    HashingBusy is raised straight away instead of letting requests pile up.
+    A pool size of 0 hashes inline, which is handy for scripts and the shell.
+    """
+
+    def __init__(self, app=None):
+        self.method = 'scrypt'
+        self.pool_size = 0
+        self.queue_size = 0
+        self.timeout = None
+        self._method_prefix = None
+        self._slots = None
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.configure(
+            method=build_method(app.config['PASSWORD_HASH_ALGORITHM'], app.config.get('PASSWORD_HASH_COST')),
+            pool_size=app.config['PASSWORD_HASH_POOL_SIZE'],
+            queue_size=app.config.get('PASSWORD_HASH_QUEUE_SIZE'),
+            timeout=app.config.get('PASSWORD_HASH_TIMEOUT'),
+        )
+        app.extensions['password_hasher'] = self
+
+    def configure(self, method='scrypt', pool_size=0, queue_size=None, timeout=None):
+        self.shutdown()
+        self.method = method
+        self.pool_size = pool_size
+        self.queue_size = queue_size or max(pool_size, 1) * 4
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._method_prefix = None
+
+    def _get_pool(self):
+        # Pools don't survive a fork, so each worker process builds its own
+        if self._pool is None or self._pool_pid != os.getpid():
+            with self._lock:
+                if self._pool is None or self._pool_pid != os.getpid():
+                    self._pool = ProcessPoolExecutor(max_workers=self.pool_size, mp_context=_pool_context())
+                    self._pool_pid = os.getpid()
+        return self._pool
+
+    def _run(self, fn, *args):
+        if not self.pool_size:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy("Password hashing queue is full")
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            # Answer 503 like a full queue; the queued job is dropped if it hasn't started
+            future.cancel()
+            raise HashingBusy("Timed out waiting for password hashing")
+
+    def hash(self, password):
+        with metrics.password_hashing.time(op='hash'):
+            return self._run(generate_password_hash, password, self.method)
+
+    def hash_many(self, passwords, wait=False):
+        """
+        Hashes a batch of passwords across the whole pool, returning hashes in input order.
+
+        Each password takes its own queue slot, and at most pool_size of them
+        are queued or running at once. A login submitted mid-batch therefore
+        waits behind at most one hash per worker, not the rest of the batch.
+        With wait=True the call blocks for free slots instead of raising HashingBusy.
+        """
+        passwords = list(passwords)
+        with metrics.password_hashing.time(op='hash_many'):
+            if not self.pool_size:
+                return [generate_password_hash(password, self.method) for password in passwords]
+
+            pool = self._get_pool()
+            in_flight = threading.BoundedSemaphore(self.pool_size)
+
+            def release(_):
+                self._slots.release()
+                in_flight.release()
+
+            futures = []
+            try:
+                for password in passwords:
+                    in_flight.acquire()
+                    if not self._slots.acquire(blocking=wait):
+                        in_flight.release()
+                        raise HashingBusy("Password hashing queue is full")
+                    try:
+                        future = pool.submit(generate_password_hash, password, self.method)
+                    except Exception:
+                        release(None)
+                        raise
+                    future.add_done_callback(release)
+                    futures.append(future)
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def verify(self, pwhash, password):
+        with metrics.password_hashing.time(op='verify'):
+            return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """
+        True when pwhash was produced with a different algorithm or cost than the current one.
+        """
+        if self._method_prefix is None:
+            self._method_prefix = method_prefix(self.method)
+            if self._method_prefix is None:
+                # Unknown method: learn the prefix from one hash, off the request thread
+                self._method_prefix = self._run(generate_password_hash, '', self.method).split('$', 1)[0]
+        return pwhash.split('$', 1)[0] != self._method_prefix
+
+    def shutdown(self):
+        if self._pool is not None and self._pool_pid == os.getpid():
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+        self._pool_pid = None
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,263 @@
+import bisect
+import hmac
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from flask import Blueprint, Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+
+metrics_bp = Blueprint('metrics', __name__)
+
+# Latency buckets in seconds, from a cache hit up to a slow KDF or report
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Prometheus-style histogram with fixed buckets, one series per label combination.
+    """
+
+    def __init__(self, name, help, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self._series = {}  # label tuple -> [per-bucket counts (last is +Inf), sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = [(key, list(counts), total, count) for key, (counts, total, count) in self._series.items()]
+        for key, counts, total, count in sorted(series):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{_format_labels(key + (("le", _format_number(bound)),))} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(key)} {total!r}')
+            lines.append(f'{self.name}_count{_format_labels(key)} {count}')
+        return lines
+
+
+class CounterMetric:
+    """
+    Monotonic counter, one series per label combination.
+    """
+
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._series = Counter()
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        with self._lock:
+            self._series[tuple(sorted(labels.items()))] += amount
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            series = sorted(self._series.items())
+        lines += [f'{self.name}{_format_labels(key)} {value}' for key, value in series]
+        return lines
+
+
+class Metrics:
+    """
+    In-process registry behind /metrics.
+
+    Values are kept per worker process, like the memory session store;
+    Prometheus is expected to scrape each worker and sum the series.
+    collect() callbacks add values owned by other components (e.g. the
+    profile cache counters) at scrape time.
+    """
+
+    def __init__(self):
+        self.request_latency = Histogram(
+            'http_request_duration_seconds', 'Time spent handling a request, by endpoint.')
+        self.request_queries = Histogram(
+            'db_queries_per_request', 'SQL statements executed per request, by endpoint.', QUERY_COUNT_BUCKETS)
+        self.request_query_time = Histogram(
+            'db_query_time_per_request_seconds', 'Total SQL time per request, by endpoint.')
+        self.query_latency = Histogram(
+            'db_query_duration_seconds', 'Time spent in a single SQL statement.')
+        self.n_plus_one = CounterMetric(
+            'db_repeated_query_warnings_total', 'Requests that repeated one SQL statement past the N+1 threshold.')
+        self.password_hashing = Histogram(
+            'password_hash_duration_seconds', 'Time spent hashing or verifying passwords, including queueing.')
+        self.session_io = Histogram(
+            'session_store_duration_seconds', 'Time spent loading and saving server-side sessions.')
+        self._collectors = []
+
+    @property
+    def metrics(self):
+        return [
+            self.request_latency, self.request_queries, self.request_query_time, self.query_latency,
+            self.n_plus_one, self.password_hashing, self.session_io,
+        ]
+
+    def add_collector(self, collect):
+        """
+        Registers a callable returning [(name, type, help, value)] to be rendered on every scrape.
+        """
+        if collect not in self._collectors:
+            self._collectors.append(collect)
+
+    def clear(self):
+        for metric in self.metrics:
+            metric.clear()
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines += metric.render()
+        for collect in self._collectors:
+            for name, kind, help, value in collect():
+                lines += [f'# HELP {name} {help}', f'# TYPE {name} {kind}', f'{name} {value}']
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+def _profile_cache_metrics():
+    from .profile_cache import profile_cache
+    stats = profile_cache.stats()
+    return [
+        ('profile_cache_hits_total', 'counter', 'Profile cache lookups served from cache.', stats['hits']),
+        ('profile_cache_misses_total', 'counter', 'Profile cache lookups that went to the database.', stats['misses']),
+        ('profile_cache_entries', 'gauge', 'Profiles held in the in-process cache.', stats['entries']),
+    ]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    metrics.query_latency.observe(elapsed)
+    if has_request_context() and 'sql_statements' in g:
+        g.sql_statements[statement] += 1
+        g.sql_seconds += elapsed
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get('query_start') if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def _endpoint():
+    return request.endpoint or 'unmatched'
+
+
+def init_metrics(app, db):
+    """
+    Records request latency, per-request SQL counts and time, and serves them at /metrics.
+
+    A request that runs the same SQL statement METRICS_N_PLUS_ONE_THRESHOLD
+    times or more is logged as a likely N+1 query.
+    """
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    threshold = app.config['METRICS_N_PLUS_ONE_THRESHOLD']
+    with app.app_context():
+        for engine in db.engines.values():
+            for identifier, fn in [
+                ('before_cursor_execute', _before_cursor_execute),
+                ('after_cursor_execute', _after_cursor_execute),
+                ('handle_error', _handle_error),
+            ]:
+                if not event.contains(engine, identifier, fn):
+                    event.listen(engine, identifier, fn)
+
+    metrics.add_collector(_profile_cache_metrics)
+    app.extensions['metrics'] = metrics
+    app.register_blueprint(metrics_bp)
+
+    @app.before_request
+    def start_timer():
+        g.request_start = time.perf_counter()
+        g.sql_statements = Counter()
+        g.sql_seconds = 0.0
+
+    @app.after_request
+    def remember_status(response):
+        g.response_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def record_request(exc):
+        # Runs after the session is saved, so its I/O is included in the latency
+        if 'request_start' not in g:
+            return
+        endpoint = _endpoint()
+        status = g.get('response_status', 500)
+        metrics.request_latency.observe(
+            time.perf_counter() - g.request_start, method=request.method, endpoint=endpoint, status=status)
+        metrics.request_queries.observe(sum(g.sql_statements.values()), endpoint=endpoint)
+        metrics.request_query_time.observe(g.sql_seconds, endpoint=endpoint)
+
+        if g.sql_statements:
+            statement, count = g.sql_statements.most_common(1)[0]
+            if count >= threshold:
+                metrics.n_plus_one.inc(endpoint=endpoint)
+                app.logger.warning(
+                    f"Possible N+1 query in {request.method} {request.path}: "
+                    f"statement ran {count} times: {' '.join(statement.split())[:200]}"
+                )
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    # Optional bearer token so the endpoint can be exposed beyond the scraper's network
+    token = current_app.config.get('METRICS_TOKEN')
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return Response("Unauthorized\n", status=401, mimetype='text/plain')
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
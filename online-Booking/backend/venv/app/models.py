@@ -0,0 +1,197 @@
+from datetime import datetime
+from enum import Enum
+from flask_sqlalchemy import SQLAlchemy
+from .hashing import HashingBusy, password_hasher
+from .database import RoutingSession
+
+# Initialize SQLAlchemy instance; RoutingSession sends read-only requests to the replica
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+class Role(Enum):
+    USER = 'User'
+    ADMIN = 'Admin'
+
+def rehash_if_needed(pwhash, password):
+    """
+    Returns a fresh hash of password if pwhash uses outdated parameters, else None.
+
+    The upgrade is best effort: when the hashing pool is saturated the old
+    hash is kept and the upgrade is retried on a later login.
+    """
+    if not password_hasher.needs_rehash(pwhash):
+        return None
+    try:
+        return password_hasher.hash(password)
+    except HashingBusy:
+        return None
+
+class User(db.Model):
+    __tablename__ = 'users'
+    
+    id_number = db.Column(db.String(50), primary_key=True)
+    full_name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    parish = db.Column(db.String(100), nullable=True)
+    user_password = db.Column('password', db.String(255), nullable=False)
+    registration_date = db.Column(db.DateTime, default=datetime.utcnow)
+    role = db.Column(db.Enum(Role), nullable=False, default=Role.USER)
+    
+    def to_dict(self):
+        """
+        Converts the User object into a dictionary for API responses.
+        """
+        return {
+            'id_number': self.id_number,
+            'full_name': self.full_name,
+            'email': self.email,
+            'parish': self.parish if self.parish else "N/A",  # Handle nullable fields
+            'registration_date': self.registration_date.strftime("%Y-%m-%d %H:%M:%S") if self.registration_date else None,
+            'role': self.role.value
+        }
+
+    @classmethod
+    def create_user(cls, id_number, full_name, email, password, parish=None):
+        """
+        Helper method to create a new user with hashed password.
+        """
+        from .stats import record_user  # stats imports the models
+        hashed_password = password_hasher.hash(password)
+        new_user = cls(
+            id_number=id_number,
+            full_name=full_name,
+            email=email,
+            user_password=hashed_password,
+            parish=parish
+        )
+        db.session.add(new_user)
+        record_user(new_user)
+        db.session.commit()
+        return new_user
+
+    def check_password(self, password):
+        """
+        Verifies if the provided password matches the stored hash.
+
+        On success a hash made with outdated parameters is replaced by one using
+        the current algorithm and cost; the caller commits the change.
+        """
+        if not password_hasher.verify(self.user_password, password):
+            return False
+        new_hash = rehash_if_needed(self.user_password, password)
+        if new_hash:
+            self.user_password = new_hash
+        return True
+    
+class Admin(db.Model):
+    __tablename__ = 'admin'
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(50), unique=True, nullable=False)
+    id_number = db.Column(db.String(50), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    phone_number = db.Column(db.String(20), nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    is_main_admin = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def set_password(self, password):
+        self.password_hash = password_hasher.hash(password)
+
+    def check_password(self, password):
+        if not password_hasher.verify(self.password_hash, password):
+            return False
+        new_hash = rehash_if_needed(self.password_hash, password)
+        if new_hash:
+            self.password_hash = new_hash
+        return True
+
+class QuoRegister(db.Model):
+    __tablename__ = 'quo_register'
+    id = db.Column(db.Integer, primary_key=True)
+    full_name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    phone_number = db.Column(db.String(20), nullable=False)
+    registration_date = db.Column(db.DateTime, default=datetime.utcnow)
+    # Add more fields as needed for your specific registration requirements
+
+    # Composite indexes backing keyset pagination on the admin users list
+    __table_args__ = (
+        db.Index('ix_quo_register_full_name_id', 'full_name', 'id'),
+        db.Index('ix_quo_register_registration_date_id', 'registration_date', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'full_name': self.full_name,
+            'email': self.email,
+            'phone_number': self.phone_number,
+            'registration_date': self.registration_date.isoformat()
+        }
+
+
+class BookingStatus(Enum):
+    PENDING = 'Pending'
+    CONFIRMED = 'Confirmed'
+    EXPIRED = 'Expired'
+
+class Slot(db.Model):
+    __tablename__ = 'slots'
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100), nullable=False)
+    starts_at = db.Column(db.DateTime, nullable=False)
+    capacity = db.Column(db.Integer, nullable=False)
+    # Pending + confirmed bookings holding a place; only ever changed with
+    # conditional UPDATEs (see app/booking.py) so it can never pass capacity
+    reserved = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.CheckConstraint('reserved >= 0 AND reserved <= capacity', name='ck_slots_reserved_within_capacity'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'starts_at': self.starts_at.isoformat(),
+            'capacity': self.capacity,
+            'available': self.capacity - self.reserved
+        }
+
+class Booking(db.Model):
+    __tablename__ = 'bookings'
+    id = db.Column(db.Integer, primary_key=True)
+    slot_id = db.Column(db.Integer, db.ForeignKey('slots.id'), nullable=False, index=True)
+    id_number = db.Column(db.String(50), db.ForeignKey('users.id_number'), nullable=False, index=True)
+    status = db.Column(db.Enum(BookingStatus), nullable=False, default=BookingStatus.PENDING)
+    hold_expires_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    confirmed_at = db.Column(db.DateTime, nullable=True)
+
+    # Lets the hold sweeper find expired pending bookings without a table scan
+    __table_args__ = (
+        db.Index('ix_bookings_status_hold_expires_at', 'status', 'hold_expires_at'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'slot_id': self.slot_id,
+            'id_number': self.id_number,
+            'status': self.status.value,
+            'hold_expires_at': self.hold_expires_at.isoformat(),
+            'created_at': self.created_at.isoformat(),
+            'confirmed_at': self.confirmed_at.isoformat() if self.confirmed_at else None
+        }
+
+class StatCounter(db.Model):
+    """
+    Pre-aggregated counter behind /api/user-stats, e.g. ('users_by_parish', 'St. Paul') -> 42.
+
+    Rows are bumped in the same transaction as the change they count, so the
+    stats endpoint never has to scan users or quo_register.
+    """
+    __tablename__ = 'stat_counters'
+    name = db.Column(db.String(50), primary_key=True)
+    bucket = db.Column(db.String(120), primary_key=True, default='')  # '' for plain totals
+    count = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,178 @@
+import base64
+import json
+from datetime import datetime
+from flask import Response, stream_with_context
+from sqlalchemy import and_, or_, select
+from .models import db
+from .schemas import encoder
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Rows fetched per round-trip when streaming from a server-side cursor
+STREAM_CHUNK_SIZE = 500
+
+
+class CursorError(ValueError):
+    """
+    Raised when a pagination cursor or page size cannot be used.
+    """
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _load_value(column, value):
+    # Cursors come from the client, so the value must match the column type
+    # before it reaches a query; TypeError ends up as CursorError
+    if value is None:
+        return None
+    if isinstance(column.type, (db.DateTime, db.String)) and not isinstance(value, str):
+        raise TypeError(f"{column.key} cursor value must be a string")
+    if isinstance(column.type, db.Integer) and (not isinstance(value, int) or isinstance(value, bool)):
+        raise TypeError(f"{column.key} cursor value must be an integer")
+    if isinstance(column.type, db.DateTime):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def encode_cursor(sort_value, row_id):
+    """
+    Encodes the (sort value, id) of the last row of a page into an opaque token.
+    """
+    payload = json.dumps([_dump_value(sort_value), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token, column):
+    """
+    Decodes a token produced by encode_cursor back into (sort value, id).
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return _load_value(column, sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise CursorError("Invalid cursor")
+
+
+def parse_limit(raw_limit):
+    """
+    Validates the requested page size, falling back to DEFAULT_PAGE_SIZE.
+    """
+    if raw_limit is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw_limit)
+    except ValueError:
+        raise CursorError("limit must be an integer")
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise CursorError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+
+def keyset_query(model, sort_column, cursor=None, columns=None):
+    """
+    Builds a query ordered by (sort_column, id) that starts after the given cursor.
+
+    The ordering matches the composite (sort_column, id) indexes, so each page
+    is an index range scan no matter how deep into the table it is. Pass
+    columns to select plain rows instead of ORM objects.
+
+    NULL sort values are ordered first, as MySQL and SQLite do for an
+    ascending ORDER BY, so a page ending on a NULL continues with the
+    remaining NULLs and then every non-NULL row.
+    """
+    query = select(*columns) if columns else select(model)
+    query = query.order_by(sort_column, model.id)
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor, sort_column)
+        if sort_value is None:
+            query = query.where(or_(
+                and_(sort_column.is_(None), model.id > last_id),
+                sort_column.is_not(None)
+            ))
+        else:
+            query = query.where(or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, model.id > last_id)
+            ))
+    return query
+
+
+def fetch_page(model, sort_column, cursor=None, limit=DEFAULT_PAGE_SIZE, columns=None):
+    """
+    Returns one page of rows plus the cursor for the next page (None on the last page).
+    """
+    result = db.session.execute(
+        keyset_query(model, sort_column, cursor, columns).limit(limit + 1)
+    )
+    rows = result.all() if columns else result.scalars().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), last.id)
+    return rows, next_cursor
+
+
+def iter_rows(query, chunk_size=STREAM_CHUNK_SIZE, scalars=True):
+    """
+    Yields rows from a server-side cursor, chunk_size rows at a time.
+
+    With scalars=True (single-entity queries) ORM objects are yielded,
+    otherwise plain result rows.
+    """
+    result = db.session.execute(query.execution_options(yield_per=chunk_size))
+    try:
+        for row in (result.scalars() if scalars else result):
+            yield row
+    finally:
+        result.close()
+
+
+def iter_chunks(rows, chunk_size=STREAM_CHUNK_SIZE):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ndjson_body(rows, serialize):
+    for chunk in iter_chunks(rows):
+        yield encoder.encode_lines([serialize(row) for row in chunk])
+
+
+def _json_array_body(rows, serialize):
+    yield b'['
+    separator = b''
+    for chunk in iter_chunks(rows):
+        # Encode the chunk as one list, then splice its items into the array
+        yield separator + encoder.encode([serialize(row) for row in chunk])[1:-1]
+        separator = b','
+    yield b']'
+
+
+def stream_response(query, serialize, fmt='json', scalars=True):
+    """
+    Streams every row of the query without materialising the result set.
+
+    serialize turns a row into something msgspec can encode (usually a
+    Struct). fmt='ndjson' emits one JSON object per line; anything else
+    emits a single JSON array written out chunk by chunk, so clients that
+    expect a plain list keep working.
+    """
+    rows = iter_rows(query, scalars=scalars)
+    if fmt == 'ndjson':
+        body, mimetype = _ndjson_body(rows, serialize), 'application/x-ndjson'
+    else:
+        body, mimetype = _json_array_body(rows, serialize), 'application/json'
+    return Response(stream_with_context(body), mimetype=mimetype)
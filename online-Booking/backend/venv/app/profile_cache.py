@@ -0,0 +1,141 @@
+import threading
+import msgspec
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from .ttl_cache import TTLCache
+
+
+def user_key(id_number):
+    return f'user:{id_number}'
+
+
+class ProfileCache:
+    """
+    Read-through cache for user dashboards.
+
+    Entries live in the shared Redis backend when one is configured, and
+    otherwise in an in-process LRU; the loader (the database) is only called
+    on a miss. With Redis there is deliberately no local tier in front of
+    it, so an invalidation is seen by every worker at once. Entries are
+    dropped when a User row is updated or deleted, both at flush and again
+    after commit, so a concurrent reader cannot re-cache the old row for
+    long. Without Redis each worker has its own copy, and another worker's
+    stale entry lives for up to PROFILE_CACHE_TTL.
+    """
+
+    def __init__(self, app=None):
+        self.ttl = 300
+        self.local = TTLCache()
+        self.shared = None
+        self.key_prefix = 'profile:'
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.ttl = app.config['PROFILE_CACHE_TTL']
+        self.local = TTLCache(max_entries=app.config['PROFILE_CACHE_MAX_ENTRIES'], default_ttl=self.ttl)
+        self.shared = app.config.get('PROFILE_CACHE_REDIS')
+        if self.shared is None and app.config.get('PROFILE_CACHE_REDIS_URL'):
+            import redis
+            self.shared = redis.Redis.from_url(app.config['PROFILE_CACHE_REDIS_URL'])
+        app.extensions['profile_cache'] = self
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key):
+        if self.shared is not None:
+            raw = self.shared.get(self.key_prefix + key)
+            value = msgspec.json.decode(raw) if raw is not None else None
+        else:
+            value = self.local.get(key)
+        self._count(value is not None)
+        return value
+
+    def set(self, key, value):
+        if self.shared is not None:
+            self.shared.setex(self.key_prefix + key, self.ttl, msgspec.json.encode(value))
+        else:
+            self.local.set(key, value)
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached value for key, calling loader() and caching its result on a miss.
+
+        A loader returning None (e.g. no such user) is not cached.
+        """
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, *keys):
+        for key in keys:
+            self.local.delete(key)
+        if self.shared is not None and keys:
+            self.shared.delete(*(self.key_prefix + key for key in keys))
+
+    def clear(self):
+        self.local.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.local)}
+
+
+profile_cache = ProfileCache()
+
+
+def invalidate_user(id_number):
+    profile_cache.invalidate(user_key(id_number))
+
+
+def _stale_keys(session):
+    return session.info.setdefault('stale_profile_keys', set())
+
+
+def _on_user_change(mapper, connection, target):
+    _stale_keys(Session.object_session(target)).add(user_key(target.id_number))
+
+
+def _invalidate_after_flush(session, flush_context):
+    keys = session.info.get('stale_profile_keys')
+    if keys:
+        profile_cache.invalidate(*keys)
+
+
+def _invalidate_after_commit(session):
+    keys = session.info.pop('stale_profile_keys', None)
+    if keys:
+        profile_cache.invalidate(*keys)
+
+
+def _forget_after_rollback(session, previous_transaction):
+    # Savepoint rollbacks (e.g. in stats.bump) keep the outer transaction's keys
+    if previous_transaction.parent is None:
+        session.info.pop('stale_profile_keys', None)
+
+
+def register_invalidation_hooks(user_model):
+    """
+    Drops cached dashboards whenever a User row is updated or deleted, through any code path.
+    """
+    hooks = [
+        (user_model, 'after_update', _on_user_change),
+        (user_model, 'after_delete', _on_user_change),
+        (Session, 'after_flush', _invalidate_after_flush),
+        (Session, 'after_commit', _invalidate_after_commit),
+        (Session, 'after_soft_rollback', _forget_after_rollback),
+    ]
+    for target, identifier, fn in hooks:
+        # create_app may run more than once per process (tests, CLI)
+        if not event.contains(target, identifier, fn):
+            event.listen(target, identifier, fn)
@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Annotated, List, Optional
+import msgspec
+from flask import Response, request
+from .models import QuoRegister
+
+# Required string fields must also be non-empty, as the old hand-written checks required
+NonEmpty = Annotated[str, msgspec.Meta(min_length=1)]
+
+encoder = msgspec.json.Encoder()
+
+
+# Request payloads
+
+class RegisterRequest(msgspec.Struct):
+    id_number: NonEmpty
+    full_name: NonEmpty
+    email: NonEmpty
+    parish: NonEmpty
+    password: NonEmpty
+
+class LoginRequest(msgspec.Struct):
+    id_number: str
+    password: str
+
+class AdminLoginRequest(msgspec.Struct):
+    email: str
+    password: str
+
+class CreateAdminRequest(msgspec.Struct):
+    username: NonEmpty
+    id_number: NonEmpty
+    email: NonEmpty
+    phone_number: NonEmpty
+    password: NonEmpty
+    is_main_admin: bool = False
+
+
+# Responses
+
+class UserOut(msgspec.Struct):
+    id_number: str
+    full_name: str
+    email: str
+    parish: str
+    registration_date: Optional[str]
+    role: str
+
+class QuoRegisterOut(msgspec.Struct):
+    id: int
+    full_name: str
+    email: str
+    phone_number: str
+    registration_date: Optional[datetime]
+
+class UsersPage(msgspec.Struct):
+    users: List[QuoRegisterOut]
+    next_cursor: Optional[str]
+
+class Dashboard(msgspec.Struct):
+    id_number: str
+    name: str
+    email: str
+    parish: Optional[str]
+    registration_date: Optional[str]
+    role: str
+
+class LoginResponse(msgspec.Struct):
+    message: str
+    user_dashboard: Dashboard
+
+
+# Columns selected for QuoRegisterOut, in field order, so list endpoints can
+# build structs straight from result rows without loading ORM objects
+QUO_REGISTER_COLUMNS = (
+    QuoRegister.id,
+    QuoRegister.full_name,
+    QuoRegister.email,
+    QuoRegister.phone_number,
+    QuoRegister.registration_date,
+)
+
+def quo_register_out(row):
+    return QuoRegisterOut(*row)
+
+def user_out(user):
+    return UserOut(
+        id_number=user.id_number,
+        full_name=user.full_name,
+        email=user.email,
+        parish=user.parish or "N/A",
+        registration_date=user.registration_date.strftime("%Y-%m-%d %H:%M:%S") if user.registration_date else None,
+        role=user.role.value
+    )
+
+
+def decode_body(struct_type):
+    """
+    Decodes and validates the request body as struct_type in a single pass.
+
+    Raises msgspec.ValidationError (or DecodeError for malformed JSON).
+    """
+    return msgspec.json.decode(request.get_data(), type=struct_type)
+
+def missing_fields(struct_type):
+    """
+    Lists the struct's fields that are absent or empty in the request body, for 400 responses.
+    """
+    body = msgspec.json.decode(request.get_data())
+    if not isinstance(body, dict):
+        return list(struct_type.__struct_fields__)
+    return [field for field in struct_type.__struct_fields__ if not body.get(field)]
+
+def json_response(obj, status=200):
+    """
+    Encodes obj (structs, lists, dicts) straight to JSON bytes.
+    """
+    return Response(encoder.encode(obj), status=status, mimetype='application/json')
@@ -0,0 +1,228 @@
+import secrets
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin, SecureCookieSessionInterface
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+from .metrics import metrics
+from .ttl_cache import Sweeper, TTLCache
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """
+    Session whose data lives in a SessionStore; the cookie only carries its id.
+    """
+
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(self):
+            self.modified = True
+
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+
+
+class SessionStore:
+    """
+    Storage backend for server-side sessions.
+
+    Implementations map a session id to the session's data with a time to
+    live. sweep() removes expired entries in batches and is called from a
+    background thread; stores that expire entries on their own return 0.
+    """
+
+    def get(self, sid):
+        raise NotImplementedError
+
+    def set(self, sid, data, ttl):
+        raise NotImplementedError
+
+    def delete(self, sid):
+        raise NotImplementedError
+
+    def sweep(self, batch_size):
+        return 0
+
+
+class MemorySessionStore(SessionStore):
+    """
+    In-process LRU store. Fast, but sessions are per process and lost on restart.
+    """
+
+    def __init__(self, max_entries=10000):
+        self.cache = TTLCache(max_entries=max_entries)
+
+    def get(self, sid):
+        data = self.cache.get(sid)
+        return dict(data) if data is not None else None
+
+    def set(self, sid, data, ttl):
+        self.cache.set(sid, dict(data), ttl)
+
+    def delete(self, sid):
+        self.cache.delete(sid)
+
+    def sweep(self, batch_size):
+        return self.cache.sweep(batch_size)
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis store shared by every worker. Keys are written with SETEX, so Redis expires them itself.
+
+    Any client exposing get/setex/delete works, which lets tests pass a fake.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, client, key_prefix='session:'):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def get(self, sid):
+        raw = self.client.get(self.key_prefix + sid)
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return self.serializer.loads(raw)
+
+    def set(self, sid, data, ttl):
+        self.client.setex(self.key_prefix + sid, max(int(ttl), 1), self.serializer.dumps(dict(data)))
+
+    def delete(self, sid):
+        self.client.delete(self.key_prefix + sid)
+
+
+class StoreSessionInterface(SessionInterface):
+    """
+    Keeps session data in a SessionStore and puts the (optionally signed) session id in the cookie.
+
+    Nothing is written back when a request leaves the session unchanged.
+    """
+
+    session_class = ServerSideSession
+
+    def __init__(self, store, use_signer=True):
+        self.store = store
+        self.use_signer = use_signer
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt='session-id', key_derivation='hmac')
+
+    def _new_session(self):
+        return self.session_class(sid=secrets.token_urlsafe(32), new=True)
+
+    def open_session(self, app, request):
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if not cookie:
+            return self._new_session()
+
+        sid = cookie
+        if self.use_signer:
+            try:
+                sid = self._signer(app).unsign(cookie).decode()
+            except BadSignature:
+                return self._new_session()
+
+        with metrics.session_io.time(op='load'):
+            data = self.store.get(sid)
+        if data is None:
+            return self._new_session()
+        return self.session_class(data, sid=sid)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session.modified:
+            return
+
+        if not session:
+            # Session was cleared (e.g. logout): drop it from the store and the browser
+            if not session.new:
+                with metrics.session_io.time(op='delete'):
+                    self.store.delete(session.sid)
+            response.delete_cookie(
+                name,
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+                httponly=self.get_cookie_httponly(app),
+            )
+            return
+
+        with metrics.session_io.time(op='save'):
+            self.store.set(session.sid, session, app.permanent_session_lifetime.total_seconds())
+
+        cookie = session.sid
+        if self.use_signer:
+            cookie = self._signer(app).sign(session.sid).decode()
+        response.set_cookie(
+            name,
+            cookie,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+class CookieSessionInterface(SecureCookieSessionInterface):
+    """
+    Stateless signed-cookie sessions that only re-send the cookie when the session changed.
+
+    Decoding and signing are timed under the same session_store_duration_seconds
+    labels as the server-side stores.
+    """
+
+    def open_session(self, app, request):
+        if not request.cookies.get(self.get_cookie_name(app)):
+            return super().open_session(app, request)
+        with metrics.session_io.time(op='load'):
+            return super().open_session(app, request)
+
+    def save_session(self, app, session, response):
+        if not session.modified:
+            return super().save_session(app, session, response)
+        with metrics.session_io.time(op='save' if session else 'delete'):
+            return super().save_session(app, session, response)
+
+    def should_set_cookie(self, app, session):
+        return session.modified
+
+
+def init_session(app):
+    """
+    Installs the session backend selected by SESSION_BACKEND ('memory', 'redis' or 'cookie').
+    """
+    backend = app.config['SESSION_BACKEND']
+
+    if backend == 'cookie':
+        app.session_interface = CookieSessionInterface()
+        return
+
+    if backend == 'memory':
+        store = MemorySessionStore(max_entries=app.config['SESSION_MEMORY_MAX_ENTRIES'])
+    elif backend == 'redis':
+        client = app.config.get('SESSION_REDIS')
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(app.config['SESSION_REDIS_URL'])
+        store = RedisSessionStore(client, key_prefix=app.config['SESSION_KEY_PREFIX'])
+    else:
+        raise ValueError(f"Unknown SESSION_BACKEND: {backend}")
+
+    app.session_interface = StoreSessionInterface(store, use_signer=app.config['SESSION_USE_SIGNER'])
+    if backend == 'memory':
+        # Redis expires keys itself; the in-process store needs a sweeper
+        app.extensions['session_sweeper'] = Sweeper(
+            store,
+            interval=app.config['SESSION_SWEEP_INTERVAL'],
+            batch_size=app.config['SESSION_SWEEP_BATCH_SIZE'],
+            name='session-sweeper',
+        ).start()
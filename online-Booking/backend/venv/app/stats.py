@@ -0,0 +1,236 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+import click
+from flask import Blueprint, request, jsonify, session
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .models import db, QuoRegister, Role, StatCounter, User
+
+stats_bp = Blueprint('stats', __name__)
+
+# Counter names kept in stat_counters
+USERS = 'users'
+USERS_BY_PARISH = 'users_by_parish'
+USERS_BY_ROLE = 'users_by_role'
+USERS_BY_DAY = 'users_by_day'
+REGISTRATIONS = 'registrations'
+REGISTRATIONS_BY_DAY = 'registrations_by_day'
+
+# Longest window reported by /api/user-stats, in days
+STATS_WINDOW_DAYS = 30
+
+# Bucket for users without a parish (NULL or empty), in Python and in SQL
+NO_PARISH = 'N/A'
+
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE
+ON_CONFLICT_INSERTS = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}
+
+
+def _upsert(table, rows):
+    # INSERT ... ON CONFLICT/DUPLICATE KEY adds to an existing count in one
+    # statement. UPDATE-then-INSERT left two transactions creating the same
+    # new bucket holding InnoDB gap locks and deadlocking on their INSERTs.
+    dialect = db.session.get_bind(mapper=StatCounter).dialect.name
+    if dialect == 'mysql':
+        stmt = mysql_insert(table)
+        stmt = stmt.on_duplicate_key_update(count=table.c.count + stmt.inserted['count'])
+    elif dialect in ON_CONFLICT_INSERTS:
+        stmt = ON_CONFLICT_INSERTS[dialect](table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.name, table.c.bucket],
+            set_={'count': table.c.count + stmt.excluded['count']}
+        )
+    else:
+        raise NotImplementedError(f"stat counters need an upsert for the {dialect} dialect")
+    db.session.execute(stmt, rows)
+
+
+def bump_many(deltas):
+    """
+    Adds {(name, bucket): delta} to the counters inside the caller's transaction, in one executemany.
+
+    Rows are written in key order so concurrent transactions lock them in the same order.
+    """
+    rows = [
+        {'name': name, 'bucket': bucket, 'count': delta}
+        for (name, bucket), delta in sorted(deltas.items())
+        if delta
+    ]
+    if rows:
+        _upsert(StatCounter.__table__, rows)
+
+
+def bump(name, bucket='', delta=1):
+    """
+    Adds delta to a counter inside the caller's transaction, creating the row on first use.
+    """
+    bump_many({(name, bucket): delta})
+
+
+def parish_bucket(parish):
+    return parish or NO_PARISH
+
+
+def _day(value):
+    return (value or datetime.utcnow()).date().isoformat()
+
+
+def record_user(user, delta=1):
+    """
+    Counts a user being added (delta=1) or removed (delta=-1). Call before committing.
+    """
+    bump_many({
+        (USERS, ''): delta,
+        (USERS_BY_PARISH, parish_bucket(user.parish)): delta,
+        (USERS_BY_ROLE, (user.role or Role.USER).value): delta,
+        (USERS_BY_DAY, _day(user.registration_date)): delta,
+    })
+
+
+def record_users(users):
+    """
+    Counts a batch of new users (objects or row dicts) with a single executemany over the distinct counters.
+    """
+    deltas = Counter()
+    for user in users:
+        if isinstance(user, dict):
+            parish, role, registration_date = user.get('parish'), user.get('role'), user.get('registration_date')
+        else:
+            parish, role, registration_date = user.parish, user.role, user.registration_date
+        deltas[(USERS, '')] += 1
+        deltas[(USERS_BY_PARISH, parish_bucket(parish))] += 1
+        deltas[(USERS_BY_ROLE, (role or Role.USER).value)] += 1
+        deltas[(USERS_BY_DAY, _day(registration_date))] += 1
+    bump_many(deltas)
+
+
+def record_registration(registration, delta=1):
+    """
+    Counts a quo_register entry being added (delta=1) or removed (delta=-1). Call before committing.
+    """
+    bump_many({
+        (REGISTRATIONS, ''): delta,
+        (REGISTRATIONS_BY_DAY, _day(registration.registration_date)): delta,
+    })
+
+
+def _day_bucket(value):
+    # func.date() comes back as a string on SQLite and a date on MySQL
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def rebuild_stats():
+    """
+    Recomputes every counter from the users and quo_register tables in one transaction.
+    """
+    counts = [(USERS, '', db.session.scalar(select(func.count()).select_from(User)))]
+    # Normalised in SQL so NULL, '' and 'N/A' land in one group, as parish_bucket() does
+    parish = func.coalesce(func.nullif(User.parish, ''), NO_PARISH)
+    counts += [
+        (USERS_BY_PARISH, bucket, count)
+        for bucket, count in db.session.execute(select(parish, func.count()).group_by(parish))
+    ]
+    counts += [
+        (USERS_BY_ROLE, role.value, count)
+        for role, count in db.session.execute(select(User.role, func.count()).group_by(User.role))
+    ]
+    user_day = func.date(User.registration_date)
+    counts += [
+        (USERS_BY_DAY, _day_bucket(day), count)
+        for day, count in db.session.execute(
+            select(user_day, func.count()).where(User.registration_date.isnot(None)).group_by(user_day)
+        )
+    ]
+    counts.append((REGISTRATIONS, '', db.session.scalar(select(func.count()).select_from(QuoRegister))))
+    registration_day = func.date(QuoRegister.registration_date)
+    counts += [
+        (REGISTRATIONS_BY_DAY, _day_bucket(day), count)
+        for day, count in db.session.execute(
+            select(registration_day, func.count())
+            .where(QuoRegister.registration_date.isnot(None))
+            .group_by(registration_day)
+        )
+    ]
+
+    db.session.execute(delete(StatCounter))
+    db.session.add_all(StatCounter(name=name, bucket=bucket, count=count) for name, bucket, count in counts)
+    db.session.commit()
+    return len(counts)
+
+
+def read_stats(today=None):
+    """
+    Builds the /api/user-stats payload from the counters alone.
+    """
+    today = today or datetime.utcnow().date()
+    window_start = (today - timedelta(days=STATS_WINDOW_DAYS - 1)).isoformat()
+    counter = StatCounter.__table__.c
+
+    rows = db.session.execute(
+        select(counter.name, counter.bucket, counter.count).where(
+            counter.name.in_([USERS, USERS_BY_PARISH, USERS_BY_ROLE, REGISTRATIONS])
+            | (counter.name.in_([USERS_BY_DAY, REGISTRATIONS_BY_DAY]) & (counter.bucket >= window_start))
+        )
+    ).all()
+
+    totals, by_parish, by_role = {}, {}, {}
+    users_by_day, registrations_by_day = {}, {}
+    for name, bucket, count in rows:
+        if name in (USERS, REGISTRATIONS):
+            totals[name] = count
+        elif name == USERS_BY_PARISH:
+            by_parish[bucket] = count
+        elif name == USERS_BY_ROLE:
+            by_role[bucket] = count
+        elif name == USERS_BY_DAY:
+            users_by_day[bucket] = count
+        else:
+            registrations_by_day[bucket] = count
+
+    def last_days(days):
+        start = (today - timedelta(days=days - 1)).isoformat()
+        return sum(count for day, count in users_by_day.items() if day >= start)
+
+    return {
+        "totalUsers": totals.get(USERS, 0),
+        "yesterdayUsers": users_by_day.get((today - timedelta(days=1)).isoformat(), 0),
+        "last7DaysUsers": last_days(7),
+        "last30DaysUsers": last_days(STATS_WINDOW_DAYS),
+        "usersByParish": by_parish,
+        "usersByRole": by_role,
+        "usersByDay": dict(sorted(users_by_day.items())),
+        "totalRegistrations": totals.get(REGISTRATIONS, 0),
+        "registrationsByDay": dict(sorted(registrations_by_day.items()))
+    }
+
+
+def init_stats(app):
+    if app.config.get('SQLALCHEMY_CREATE_ALL'):
+        # Tables made by create_all miss the migration's backfill; count the
+        # existing rows once so later deltas start from the real totals
+        with app.app_context():
+            if db.session.scalar(select(func.count()).select_from(StatCounter)) == 0:
+                rebuild_stats()
+
+    @app.cli.group('stats')
+    def stats_cli():
+        """Maintain the stat_counters summary table."""
+
+    @stats_cli.command('rebuild')
+    def rebuild_command():
+        """Recompute all counters from scratch."""
+        click.echo(f"Rebuilt {rebuild_stats()} counters")
+
+
+# Dashboard statistics (Admins only)
+@stats_bp.route('/user-stats', methods=['GET'])
+def user_stats():
+    if 'admin_id' not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+
+    response = jsonify(read_stats())
+    response.add_etag()
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
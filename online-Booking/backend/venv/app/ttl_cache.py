@@ -0,0 +1,110 @@
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU mapping whose entries expire after a per-entry time to live.
+
+    Reads drop an expired entry lazily; sweep() removes expired entries in
+    bounded batches so it can run from a background thread instead of
+    making a request pay for the cleanup.
+    """
+
+    def __init__(self, max_entries=10000, default_ttl=300, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._expiry = []  # heap of (expires_at, key); stale items are skipped on pop
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        expires_at = self._clock() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            heapq.heappush(self._expiry, (expires_at, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if len(self._expiry) > 2 * self.max_entries + 64:
+                self._compact()
+
+    def delete(self, key):
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+
+    def sweep(self, batch_size=1000):
+        """
+        Removes up to batch_size expired entries and returns how many were removed.
+        """
+        removed = 0
+        now = self._clock()
+        with self._lock:
+            while self._expiry and removed < batch_size and self._expiry[0][0] <= now:
+                expires_at, key = heapq.heappop(self._expiry)
+                entry = self._entries.get(key)
+                # Only drop the entry if this heap item is its current expiry
+                if entry is not None and entry[0] == expires_at:
+                    del self._entries[key]
+                    removed += 1
+        return removed
+
+    def _compact(self):
+        # Rebuild the heap from live entries once overwrites and evictions
+        # have left it mostly stale
+        self._expiry = [(expires_at, key) for key, (expires_at, _) in self._entries.items()]
+        heapq.heapify(self._expiry)
+
+
+class Sweeper:
+    """
+    Daemon thread that calls sweep(batch_size) on a target every interval seconds.
+    """
+
+    def __init__(self, target, interval=60, batch_size=1000, name='ttl-sweeper'):
+        self.target = target
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                # Keep sweeping while full batches come back, then sleep again
+                while self.target.sweep(self.batch_size) >= self.batch_size:
+                    pass
+            except Exception:
+                logger.exception(f"{self._thread.name} sweep failed")
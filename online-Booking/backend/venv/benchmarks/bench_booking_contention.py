@@ -0,0 +1,106 @@
+"""
+Hammers the reservation engine from many threads against SQLite and checks for overbooking.
+
+Every thread keeps reserving seats on random slots until all of them are
+full. Afterwards each slot's reserved counter is compared with its capacity
+and with the number of bookings actually stored for it.
+
+    python benchmarks/bench_booking_contention.py --threads 16 --slots 20 --capacity 50
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select  # noqa: E402
+from app import create_app  # noqa: E402
+from app.booking import BookingError, reserve  # noqa: E402
+from app.config import SQLiteConfig, engine_options  # noqa: E402
+from app.models import db, Booking, Slot, User  # noqa: E402
+
+
+def make_config(db_path, threads):
+    class BenchConfig(SQLiteConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        # One pooled connection per thread so no client waits on the pool
+        SQLALCHEMY_ENGINE_OPTIONS = {**engine_options(SQLALCHEMY_DATABASE_URI), 'pool_size': threads}
+        SECRET_KEY = 'bench'
+        SESSION_BACKEND = 'cookie'
+        PASSWORD_HASH_POOL_SIZE = 0
+        BOOKING_SWEEPER_ENABLED = False
+
+    return BenchConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--slots', type=int, default=20)
+    parser.add_argument('--capacity', type=int, default=50)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), 'bench_booking.db')
+    app = create_app(make_config(db_path, args.threads))
+    with app.app_context():
+        db.session.add_all(
+            User(id_number=str(i), full_name=f'User {i}', email=f'user{i}@example.com', user_password='x')
+            for i in range(args.threads)
+        )
+        db.session.add_all(
+            Slot(title=f'Slot {i}', starts_at=datetime.utcnow(), capacity=args.capacity, reserved=0)
+            for i in range(args.slots)
+        )
+        db.session.commit()
+        slot_ids = [slot.id for slot in Slot.query.all()]
+
+    succeeded = [0] * args.threads
+    rejected = [0] * args.threads
+
+    def client(index):
+        rng = random.Random(index)
+        open_slots = list(slot_ids)
+        with app.app_context():
+            while open_slots:
+                slot_id = rng.choice(open_slots)
+                try:
+                    reserve(slot_id, str(index), hold_seconds=600)
+                    succeeded[index] += 1
+                except BookingError:
+                    rejected[index] += 1
+                    open_slots.remove(slot_id)
+            db.session.remove()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        booked = dict(db.session.execute(
+            select(Booking.slot_id, func.count()).group_by(Booking.slot_id)
+        ).all())
+        overbooked = [
+            slot.id for slot in Slot.query.all()
+            if slot.reserved > slot.capacity or booked.get(slot.id, 0) != slot.reserved
+        ]
+
+    total = sum(succeeded)
+    print(f"threads={args.threads} slots={args.slots} capacity={args.capacity}")
+    print(f"reservations: {total} (expected {args.slots * args.capacity}), rejected attempts: {sum(rejected)}")
+    print(f"elapsed: {elapsed:.2f}s, reservations/sec: {total / elapsed:.1f}")
+    print(f"overbooked or inconsistent slots: {len(overbooked)}")
+    if overbooked or total != args.slots * args.capacity:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
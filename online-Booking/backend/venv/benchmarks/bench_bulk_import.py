@@ -0,0 +1,80 @@
+"""
+Measures bulk import and export throughput (rows/sec) against a SQLite-backed app.
+
+Builds a CSV of --rows users, posts it to /admin/users/import and then streams
+/admin/users/export back. The default hash method is deliberately cheap so the
+numbers reflect parsing, validation and batched inserts; pass
+--hash-method scrypt to include the real KDF cost.
+
+    python benchmarks/bench_bulk_import.py --rows 100000 --batch-size 1000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from app.config import SQLiteConfig, engine_options  # noqa: E402
+
+
+def make_config(db_path, args):
+    class BenchConfig(SQLiteConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+        SECRET_KEY = 'bench'
+        SESSION_BACKEND = 'cookie'
+        PASSWORD_HASH_ALGORITHM = args.hash_method
+        PASSWORD_HASH_COST = None
+        PASSWORD_HASH_POOL_SIZE = args.pool_size
+        BOOKING_SWEEPER_ENABLED = False
+
+    return BenchConfig
+
+
+def build_csv(rows):
+    lines = ['id_number,full_name,email,parish,password']
+    lines += [f'{i:08d},User {i},user{i}@example.com,Parish {i % 50},Secret@{i}' for i in range(rows)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--hash-method', default='pbkdf2:sha256:1000')
+    parser.add_argument('--pool-size', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), 'bench_bulk.db')
+    app = create_app(make_config(db_path, args))
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['admin_id'] = 1
+
+    payload = build_csv(args.rows)
+    start = time.perf_counter()
+    response = client.post(
+        f'/admin/users/import?batch_size={args.batch_size}',
+        data=payload,
+        content_type='text/csv'
+    )
+    elapsed = time.perf_counter() - start
+    report = response.get_json()
+    print(f"rows={args.rows} batch_size={args.batch_size} hash={args.hash_method} pool={args.pool_size}")
+    print(f"import: inserted={report['inserted']} failed={report['failed']} "
+          f"in {elapsed:.2f}s -> {report['inserted'] / elapsed:.0f} rows/sec")
+
+    start = time.perf_counter()
+    response = client.get('/admin/users/export?format=csv')
+    exported = sum(chunk.count(b'\n') for chunk in response.response) - 1  # minus header
+    elapsed = time.perf_counter() - start
+    print(f"export: {exported} rows in {elapsed:.2f}s -> {exported / elapsed:.0f} rows/sec")
+
+    app.extensions['password_hasher'].shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Compares the old jsonify/to_dict JSON path with the msgspec Structs used by the endpoints.
+
+Three measurements:
+  * encoding a large /admin/users response (--rows quo_register rows)
+  * the /admin/users endpoint itself against SQLite
+  * decoding + validating register and login payloads (--payloads each)
+
+    python benchmarks/bench_json_encoding.py --rows 50000 --payloads 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msgspec  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+from app import create_app  # noqa: E402
+from app.auth import validate_password  # noqa: E402
+from app.config import SQLiteConfig, engine_options  # noqa: E402
+from app.models import db, QuoRegister  # noqa: E402
+from app.schemas import QUO_REGISTER_COLUMNS, LoginRequest, RegisterRequest, encoder, quo_register_out  # noqa: E402
+from app.utils import validate_email  # noqa: E402
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label, old, new, unit_count, unit):
+    print(f"{label:<34} old {unit_count / old:>12,.0f} {unit}/s   new {unit_count / new:>12,.0f} {unit}/s   x{old / new:.1f}")
+
+
+def make_config(db_path):
+    class BenchConfig(SQLiteConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+        SECRET_KEY = 'bench'
+        SESSION_BACKEND = 'cookie'
+        PASSWORD_HASH_POOL_SIZE = 0
+        BOOKING_SWEEPER_ENABLED = False
+
+    return BenchConfig
+
+
+def old_register_checks(body):
+    user_data = json.loads(body)
+    required_fields = ['id_number', 'full_name', 'email', 'parish', 'password']
+    if [field for field in required_fields if not user_data.get(field)]:
+        return None
+    return validate_email(user_data['email']) and validate_password(user_data['password'])
+
+
+def new_register_checks(body):
+    user_data = msgspec.json.decode(body, type=RegisterRequest)
+    return validate_email(user_data.email) and validate_password(user_data.password)
+
+
+def old_login_checks(body):
+    credentials = json.loads(body)
+    return credentials and 'id_number' in credentials and 'password' in credentials
+
+
+def new_login_checks(body):
+    return msgspec.json.decode(body, type=LoginRequest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--payloads', type=int, default=100000)
+    args = parser.parse_args()
+
+    app = create_app(make_config(os.path.join(tempfile.mkdtemp(), 'bench_json.db')))
+    now = datetime.utcnow()
+    with app.app_context():
+        db.session.execute(insert(QuoRegister), [
+            {'full_name': f'User {i}', 'email': f'user{i}@example.com', 'phone_number': '0700000000', 'registration_date': now}
+            for i in range(args.rows)
+        ])
+        db.session.commit()
+
+        objects = QuoRegister.query.order_by(QuoRegister.full_name, QuoRegister.id).all()
+        rows = db.session.execute(select(*QUO_REGISTER_COLUMNS).order_by(QuoRegister.full_name, QuoRegister.id)).all()
+
+        # What jsonify did: to_dict per row, then json.dumps with sorted keys
+        old = timed(lambda: app.json.dumps([user.to_dict() for user in objects]).encode())
+        new = timed(lambda: encoder.encode([quo_register_out(row) for row in rows]))
+        report(f"encode {args.rows} users", old, new, args.rows, 'rows')
+
+        old = timed(lambda: app.json.dumps([user.to_dict() for user in QuoRegister.query.all()]).encode(), repeat=1)
+        new = timed(lambda: encoder.encode([
+            quo_register_out(row) for row in db.session.execute(select(*QUO_REGISTER_COLUMNS))
+        ]), repeat=1)
+        report(f"query+encode {args.rows} users", old, new, args.rows, 'rows')
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['admin_id'] = 1
+    start = time.perf_counter()
+    body = client.get('/admin/users').data
+    elapsed = time.perf_counter() - start
+    print(f"{'GET /admin/users (streamed)':<34} {args.rows / elapsed:>16,.0f} rows/s   {len(body) / 1e6:.1f} MB")
+
+    register_body = json.dumps({
+        'id_number': '12345678', 'full_name': 'Jane Doe', 'email': 'jane@example.com',
+        'parish': 'St. Paul', 'password': 'Secret@123'
+    }).encode()
+    login_body = json.dumps({'id_number': '12345678', 'password': 'Secret@123'}).encode()
+    n = args.payloads
+    report("decode+validate register", timed(lambda: [old_register_checks(register_body) for _ in range(n)]),
+           timed(lambda: [new_register_checks(register_body) for _ in range(n)]), n, 'req')
+    report("decode+validate login", timed(lambda: [old_login_checks(login_body) for _ in range(n)]),
+           timed(lambda: [new_login_checks(login_body) for _ in range(n)]), n, 'req')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Drives register/login/dashboard/admin-list against a SQLite-backed app over HTTP
+with concurrent clients and reports p50/p99 latency and requests/sec.
+
+The app runs in a threaded werkzeug server on a random local port. Each
+client thread repeats: register a new user, log in, fetch the dashboard
+--dashboards times and fetch one page of the admin user list. Run it
+before and after a change; --fail-p99-ms makes it exit non-zero when any
+operation gets slower than the budget, so it can gate CI.
+
+    python benchmarks/bench_load.py --clients 16 --iterations 50 --rows 10000
+"""
+import argparse
+import http.cookiejar
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+from werkzeug.serving import make_server  # noqa: E402
+from app import create_app  # noqa: E402
+from app.config import SQLiteConfig, engine_options  # noqa: E402
+from app.models import db, Admin, QuoRegister  # noqa: E402
+
+OPERATIONS = ['register', 'login', 'dashboard', 'admin-list']
+ADMIN_EMAIL = 'admin@example.com'
+PASSWORD = 'Secret@123'
+
+
+def make_config(db_path, args):
+    class BenchConfig(SQLiteConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        # One pooled connection per server thread so no request waits on the pool
+        SQLALCHEMY_ENGINE_OPTIONS = {**engine_options(SQLALCHEMY_DATABASE_URI), 'pool_size': args.clients}
+        SECRET_KEY = 'bench'
+        SESSION_BACKEND = args.session_backend
+        PASSWORD_HASH_ALGORITHM = args.hash_method
+        PASSWORD_HASH_COST = None
+        PASSWORD_HASH_POOL_SIZE = args.pool_size
+        PASSWORD_HASH_QUEUE_SIZE = max(args.clients, args.pool_size * 4)
+        BOOKING_SWEEPER_ENABLED = False
+
+    return BenchConfig
+
+
+def seed(app, rows):
+    now = datetime.utcnow()
+    with app.app_context():
+        admin = Admin(username='bench', id_number='00000000', email=ADMIN_EMAIL, phone_number='0700000000')
+        admin.set_password(PASSWORD)
+        db.session.add(admin)
+        db.session.execute(insert(QuoRegister), [
+            {'full_name': f'User {i}', 'email': f'user{i}@example.com', 'phone_number': '0700000000', 'registration_date': now}
+            for i in range(rows)
+        ])
+        db.session.commit()
+
+
+class Client:
+    """
+    One browser-like HTTP client with its own cookie jar.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method)
+        if data is not None:
+            req.add_header('Content-Type', 'application/json')
+        try:
+            with self.opener.open(req) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            e.read()
+            return e.code
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float('nan')
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--iterations', type=int, default=50, help='register/login/dashboard/admin-list rounds per client')
+    parser.add_argument('--dashboards', type=int, default=5, help='dashboard fetches per round')
+    parser.add_argument('--rows', type=int, default=10000, help='quo_register rows behind the admin list')
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--session-backend', default='memory')
+    parser.add_argument('--hash-method', default='pbkdf2:sha256:1000')
+    parser.add_argument('--pool-size', type=int, default=0)
+    parser.add_argument('--fail-p99-ms', type=float, help='exit 1 if any operation has a p99 above this')
+    parser.add_argument('--show-metrics', action='store_true', help='print the /metrics scrape at the end')
+    args = parser.parse_args()
+
+    app = create_app(make_config(os.path.join(tempfile.mkdtemp(), 'bench_load.db'), args))
+    app.logger.setLevel(logging.WARNING)  # Keep N+1 warnings, drop per-request info logs
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    seed(app, args.rows)
+
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    latencies = {op: [] for op in OPERATIONS}
+    errors = {op: 0 for op in OPERATIONS}
+    lock = threading.Lock()
+
+    def timed(op, expected, call):
+        start = time.perf_counter()
+        status = call()
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies[op].append(elapsed)
+            if status != expected:
+                errors[op] += 1
+
+    def run_client(index):
+        user = Client(base_url)
+        admin = Client(base_url)
+        admin.request('POST', '/admin/login', {'email': ADMIN_EMAIL, 'password': PASSWORD})
+        for i in range(args.iterations):
+            id_number = f'{index:04d}{i:06d}'
+            timed('register', 201, lambda: user.request('POST', '/auth/register', {
+                'id_number': id_number, 'full_name': f'Load {id_number}', 'email': f'load{id_number}@example.com',
+                'parish': f'Parish {index % 10}', 'password': PASSWORD
+            }))
+            timed('login', 200, lambda: user.request('POST', '/auth/login', {'id_number': id_number, 'password': PASSWORD}))
+            for _ in range(args.dashboards):
+                timed('dashboard', 200, lambda: user.request('GET', '/auth/dashboard'))
+            timed('admin-list', 200, lambda: admin.request('GET', f'/admin/users?limit={args.page_size}'))
+
+    threads = [threading.Thread(target=run_client, args=(i,)) for i in range(args.clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"clients={args.clients} iterations={args.iterations} dashboards={args.dashboards} rows={args.rows} "
+          f"session={args.session_backend} hash={args.hash_method} pool={args.pool_size}")
+    print(f"{'operation':<12} {'count':>7} {'errors':>7} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9}")
+    slow = []
+    for op in OPERATIONS:
+        values = sorted(latencies[op])
+        p50, p99 = percentile(values, 0.50) * 1000, percentile(values, 0.99) * 1000
+        print(f"{op:<12} {len(values):>7} {errors[op]:>7} {p50:>9.2f} {p99:>9.2f} {len(values) / elapsed:>9.1f}")
+        if args.fail_p99_ms is not None and p99 > args.fail_p99_ms:
+            slow.append(op)
+    total = sum(len(values) for values in latencies.values())
+    print(f"total: {total} requests in {elapsed:.2f}s -> {total / elapsed:.1f} req/s, errors: {sum(errors.values())}")
+
+    if args.show_metrics:
+        print(app.extensions['metrics'].render(), end='')
+
+    server.shutdown()
+    app.extensions['password_hasher'].shutdown()
+    if slow:
+        print(f"p99 above {args.fail_p99_ms} ms: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Measures password verifications (logins) per second for different hashing pool sizes.
+
+Each run keeps --clients threads verifying a password through the shared
+PasswordHasher, the same call auth.login makes. Pool size 0 is the old
+behaviour of hashing on the request thread.
+
+    python benchmarks/bench_password_hashing.py --pool-sizes 0 1 2 4 --clients 16
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.hashing import HashingBusy, PasswordHasher, build_method  # noqa: E402
+
+
+def run(hasher, pwhash, clients, duration):
+    done = [0] * clients
+    rejected = [0] * clients
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        while time.perf_counter() < deadline:
+            try:
+                if hasher.verify(pwhash, 'Secret@123'):
+                    done[index] += 1
+            except HashingBusy:
+                rejected[index] += 1
+                time.sleep(0.01)  # A real client would back off after a 503
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(done) / elapsed, sum(rejected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--algorithm', default='scrypt')
+    parser.add_argument('--cost', type=int, default=None)
+    parser.add_argument('--pool-sizes', type=int, nargs='+', default=[0, 1, 2, os.cpu_count() or 1])
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--queue-size', type=int, default=None)
+    parser.add_argument('--duration', type=float, default=5.0)
+    args = parser.parse_args()
+
+    method = build_method(args.algorithm, args.cost)
+    hasher = PasswordHasher()
+    hasher.configure(method=method)
+    pwhash = hasher.hash('Secret@123')
+
+    print(f"method={method} clients={args.clients} duration={args.duration}s")
+    print(f"{'pool':>6} {'logins/sec':>12} {'rejected (503)':>16}")
+    for pool_size in args.pool_sizes:
+        hasher.configure(method=method, pool_size=pool_size, queue_size=args.queue_size)
+        if pool_size:
+            hasher.verify(pwhash, 'warm-up')  # Start the worker processes outside the timed run
+        rate, rejected = run(hasher, pwhash, args.clients, args.duration)
+        print(f"{pool_size:>6} {rate:>12.1f} {rejected:>16}")
+    hasher.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""Add composite indexes for keyset pagination of quo_register
+
+Revision ID: 3f1c9a7d2b64
+Revises: 0ea8ca55a868
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b64'
+down_revision = '0ea8ca55a868'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('quo_register', schema=None) as batch_op:
+        batch_op.create_index('ix_quo_register_full_name_id', ['full_name', 'id'], unique=False)
+        batch_op.create_index('ix_quo_register_registration_date_id', ['registration_date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('quo_register', schema=None) as batch_op:
+        batch_op.drop_index('ix_quo_register_registration_date_id')
+        batch_op.drop_index('ix_quo_register_full_name_id')
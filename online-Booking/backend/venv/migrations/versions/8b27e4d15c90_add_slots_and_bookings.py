@@ -0,0 +1,55 @@
+"""Add slots and bookings tables
+
+Revision ID: 8b27e4d15c90
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-18 14:37:05.772931
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b27e4d15c90'
+down_revision = '3f1c9a7d2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('slots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=100), nullable=False),
+        sa.Column('starts_at', sa.DateTime(), nullable=False),
+        sa.Column('capacity', sa.Integer(), nullable=False),
+        sa.Column('reserved', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.CheckConstraint('reserved >= 0 AND reserved <= capacity', name='ck_slots_reserved_within_capacity'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('bookings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('slot_id', sa.Integer(), nullable=False),
+        sa.Column('id_number', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'CONFIRMED', 'EXPIRED', name='bookingstatus'), nullable=False),
+        sa.Column('hold_expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('confirmed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['id_number'], ['users.id_number'], ),
+        sa.ForeignKeyConstraint(['slot_id'], ['slots.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_bookings_id_number'), ['id_number'], unique=False)
+        batch_op.create_index(batch_op.f('ix_bookings_slot_id'), ['slot_id'], unique=False)
+        batch_op.create_index('ix_bookings_status_hold_expires_at', ['status', 'hold_expires_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookings_status_hold_expires_at')
+        batch_op.drop_index(batch_op.f('ix_bookings_slot_id'))
+        batch_op.drop_index(batch_op.f('ix_bookings_id_number'))
+
+    op.drop_table('bookings')
+    op.drop_table('slots')
@@ -0,0 +1,65 @@
+"""Add stat_counters summary table
+
+Revision ID: c4e8a0f7d312
+Revises: 8b27e4d15c90
+Create Date: 2026-10-18 16:05:49.120377
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a0f7d312'
+down_revision = '8b27e4d15c90'
+branch_labels = None
+depends_on = None
+
+stat_counters = sa.table(
+    'stat_counters',
+    sa.column('name', sa.String),
+    sa.column('bucket', sa.String),
+    sa.column('count', sa.Integer),
+)
+users = sa.table(
+    'users',
+    sa.column('parish', sa.String),
+    sa.column('role', sa.String),
+    sa.column('registration_date', sa.DateTime),
+)
+quo_register = sa.table('quo_register', sa.column('registration_date', sa.DateTime))
+
+
+def _backfill(name, table, bucket=None, where=None):
+    # INSERT INTO stat_counters SELECT name, bucket, COUNT(*) FROM table [WHERE ...] [GROUP BY bucket]
+    query = sa.select(sa.literal(name), sa.literal('') if bucket is None else bucket, sa.func.count()).select_from(table)
+    if where is not None:
+        query = query.where(where)
+    if bucket is not None:
+        query = query.group_by(bucket)
+    op.execute(stat_counters.insert().from_select(['name', 'bucket', 'count'], query))
+
+
+def upgrade():
+    op.create_table('stat_counters',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('bucket', sa.String(length=120), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name', 'bucket')
+    )
+    # Count the rows that already exist, the same way `flask stats rebuild` does
+    # (role is stored as the enum name; the counters use its value)
+    parish = sa.func.coalesce(sa.func.nullif(users.c.parish, ''), 'N/A')
+    role = sa.case((users.c.role == 'USER', 'User'), (users.c.role == 'ADMIN', 'Admin'), else_=users.c.role)
+    _backfill('users', users)
+    _backfill('users_by_parish', users, parish)
+    _backfill('users_by_role', users, role)
+    _backfill('users_by_day', users, sa.func.date(users.c.registration_date),
+              users.c.registration_date.isnot(None))
+    _backfill('registrations', quo_register)
+    _backfill('registrations_by_day', quo_register, sa.func.date(quo_register.c.registration_date),
+              quo_register.c.registration_date.isnot(None))
+
+
+def downgrade():
+    op.drop_table('stat_counters')
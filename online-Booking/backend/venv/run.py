@@ -0,0 +1,11 @@
+import multiprocessing
+from app import create_app
+
+
+# Password hashing workers are started with forkserver/spawn, which re-imports
+# this module in each worker; they only hash and must not build a second app
+app = create_app() if multiprocessing.parent_process() is None else None
+
+
+if __name__ == "__main__":
+    app.run(debug=True, host="0.0.0.0")
@@ -0,0 +1,72 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from app.config import SQLiteConfig, engine_options  # noqa: E402
+
+PASSWORD = 'Secret@123'
+
+
+class FakeRedis:
+    """
+    The subset of the redis client RedisSessionStore uses, counting writes and deletes.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.writes = 0
+        self.deletes = 0
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.writes += 1
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, *keys):
+        self.deletes += 1
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """
+    Builds a SQLite-backed app; keyword arguments override config values.
+    """
+    apps = []
+
+    def factory(**overrides):
+        class TestConfig(SQLiteConfig):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "test.db"}'
+            SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+            SECRET_KEY = 'test'
+            SESSION_BACKEND = 'cookie'
+            PASSWORD_HASH_ALGORITHM = 'pbkdf2:sha256:1000'
+            PASSWORD_HASH_POOL_SIZE = 0
+            BOOKING_SWEEPER_ENABLED = False
+
+        for name, value in overrides.items():
+            setattr(TestConfig, name, value)
+        app = create_app(TestConfig)
+        app.config['TESTING'] = True
+        apps.append(app)
+        return app
+
+    yield factory
+    for app in apps:
+        sweeper = app.extensions.get('session_sweeper')
+        if sweeper is not None:
+            sweeper.stop()
+
+
+def register_and_login(client, id_number='12345678'):
+    client.post('/auth/register', json={
+        'id_number': id_number, 'full_name': 'Jane Doe', 'email': f'{id_number}@example.com',
+        'parish': 'St. Paul', 'password': PASSWORD
+    })
+    return client.post('/auth/login', json={'id_number': id_number, 'password': PASSWORD})
@@ -0,0 +1,127 @@
+import threading
+from datetime import datetime, timedelta
+import pytest
+from app.booking import BookingError, expire_holds, reserve
+from app.models import db, Booking, BookingStatus, Slot, User
+from conftest import register_and_login
+
+
+def add_slot(app, capacity):
+    with app.app_context():
+        slot = Slot(title='Morning Mass', starts_at=datetime.utcnow() + timedelta(days=1), capacity=capacity, reserved=0)
+        db.session.add(slot)
+        db.session.commit()
+        return slot.id
+
+
+def add_users(app, count):
+    with app.app_context():
+        db.session.add_all(
+            User(id_number=str(i), full_name=f'User {i}', email=f'user{i}@example.com', user_password='x')
+            for i in range(count)
+        )
+        db.session.commit()
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+def test_full_slot_answers_409(app):
+    slot_id = add_slot(app, capacity=1)
+    first, second = app.test_client(), app.test_client()
+    register_and_login(first, '11111111')
+    register_and_login(second, '22222222')
+
+    assert first.post('/bookings', json={'slot_id': slot_id}).status_code == 201
+    response = second.post('/bookings', json={'slot_id': slot_id})
+    assert response.status_code == 409
+    assert response.get_json() == {"message": "Slot is fully booked"}
+
+
+def test_unknown_slot_answers_404(app):
+    client = app.test_client()
+    register_and_login(client)
+
+    response = client.post('/bookings', json={'slot_id': 999})
+    assert response.status_code == 404
+    assert response.get_json() == {"message": "Slot not found"}
+
+
+def test_confirm_after_hold_expired_answers_409(app):
+    slot_id = add_slot(app, capacity=1)
+    client = app.test_client()
+    register_and_login(client)
+    booking_id = client.post('/bookings', json={'slot_id': slot_id}).get_json()['id']
+
+    with app.app_context():
+        db.session.get(Booking, booking_id).hold_expires_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+    response = client.post(f'/bookings/{booking_id}/confirm')
+    assert response.status_code == 409
+    assert response.get_json() == {"message": "Booking hold has expired"}
+
+
+def test_confirm_within_hold(app):
+    slot_id = add_slot(app, capacity=1)
+    client = app.test_client()
+    register_and_login(client)
+    booking_id = client.post('/bookings', json={'slot_id': slot_id}).get_json()['id']
+
+    response = client.post(f'/bookings/{booking_id}/confirm')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == BookingStatus.CONFIRMED.value
+
+
+def test_expire_holds_frees_seats_and_keeps_confirmed_bookings(app):
+    slot_id = add_slot(app, capacity=3)
+    add_users(app, 3)
+    past = datetime.utcnow() - timedelta(minutes=1)
+    with app.app_context():
+        expired = reserve(slot_id, '0', hold_seconds=600)
+        live = reserve(slot_id, '1', hold_seconds=600)
+        confirmed = reserve(slot_id, '2', hold_seconds=600)
+        expired.hold_expires_at = past
+        confirmed.status = BookingStatus.CONFIRMED
+        confirmed.hold_expires_at = past  # A confirmed booking's old hold time must not matter
+        db.session.commit()
+        ids = expired.id, live.id, confirmed.id
+
+        assert expire_holds() == 1
+        assert expire_holds() == 0  # Nothing is released twice
+
+        db.session.expire_all()
+        assert db.session.get(Slot, slot_id).reserved == 2
+        statuses = [db.session.get(Booking, booking_id).status for booking_id in ids]
+        assert statuses == [BookingStatus.EXPIRED, BookingStatus.PENDING, BookingStatus.CONFIRMED]
+
+
+def test_concurrent_reservations_never_oversell(app):
+    capacity, threads, attempts = 5, 8, 3
+    slot_id = add_slot(app, capacity=capacity)
+    add_users(app, threads)
+    succeeded, rejected = [], []
+
+    def client(index):
+        with app.app_context():
+            for _ in range(attempts):
+                try:
+                    reserve(slot_id, str(index), hold_seconds=600)
+                    succeeded.append(index)
+                except BookingError:
+                    rejected.append(index)
+            db.session.remove()
+
+    workers = [threading.Thread(target=client, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(succeeded) == capacity
+    assert len(rejected) == threads * attempts - capacity
+    with app.app_context():
+        assert db.session.get(Slot, slot_id).reserved == capacity
+        assert Booking.query.filter_by(slot_id=slot_id).count() == capacity
@@ -0,0 +1,22 @@
+import re
+from app.metrics import metrics
+from conftest import register_and_login
+
+
+def session_io_counts(scrape):
+    return {
+        op: int(count)
+        for op, count in re.findall(r'^session_store_duration_seconds_count\{op="(\w+)"\} (\d+)$', scrape, re.M)
+    }
+
+
+def test_cookie_sessions_are_timed(make_app):
+    client = make_app(SESSION_BACKEND='cookie').test_client()
+    metrics.clear()
+
+    register_and_login(client)  # Login writes the cookie
+    client.get('/auth/dashboard')  # Loads it, writes nothing
+    client.post('/auth/logout')  # Loads it, then expires it
+
+    scrape = client.get('/metrics').get_data(as_text=True)
+    assert session_io_counts(scrape) == {'load': 2, 'save': 1, 'delete': 1}
@@ -0,0 +1,51 @@
+import base64
+import json
+from datetime import datetime, timedelta
+import pytest
+from app.models import db, QuoRegister
+
+
+def make_cursor(sort_value, row_id):
+    payload = json.dumps([sort_value, row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+@pytest.fixture
+def admin_client(make_app):
+    app = make_app()
+    now = datetime.utcnow()
+    with app.app_context():
+        db.session.add_all(
+            QuoRegister(full_name=f'User {i}', email=f'user{i}@example.com', phone_number='0700000000',
+                        registration_date=now + timedelta(days=i))
+            for i in range(5)
+        )
+        db.session.commit()
+        # Dates cleared after insert, since the column default fills in a None
+        db.session.query(QuoRegister).filter(QuoRegister.id <= 3).update({'registration_date': None})
+        db.session.commit()
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['admin_id'] = 1
+    return client
+
+
+def test_pages_continue_past_null_sort_values(admin_client):
+    seen, cursor = [], None
+    while True:
+        url = '/admin/users/sort?sort_by=registration_date&limit=2'
+        response = admin_client.get(url + (f'&cursor={cursor}' if cursor else ''))
+        assert response.status_code == 200
+        page = response.get_json()
+        seen += [user['id'] for user in page['users']]
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert seen == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('sort_value', [[1], {'a': 1}, 5, True])
+def test_cursor_with_wrong_value_type_is_rejected(admin_client, sort_value):
+    response = admin_client.get(f'/admin/users/sort?sort_by=full_name&limit=2&cursor={make_cursor(sort_value, 1)}')
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "Invalid cursor"}
@@ -0,0 +1,31 @@
+from app.models import db, User
+from app.profile_cache import ProfileCache, user_key
+from conftest import FakeRedis, register_and_login
+
+
+def make_cache(shared=None):
+    cache = ProfileCache()
+    cache.shared = shared
+    return cache
+
+
+def test_invalidation_reaches_other_workers_through_redis():
+    redis = FakeRedis()
+    writer, reader = make_cache(redis), make_cache(redis)
+    writer.set(user_key('1'), {'name': 'Old Name'})
+    assert reader.get(user_key('1')) == {'name': 'Old Name'}
+
+    writer.invalidate(user_key('1'))
+    assert reader.get(user_key('1')) is None
+
+
+def test_user_update_drops_cached_dashboard(make_app):
+    app = make_app()
+    client = app.test_client()
+    register_and_login(client)
+    assert client.get('/auth/dashboard').get_json()['name'] == 'Jane Doe'
+
+    with app.app_context():
+        User.query.filter_by(id_number='12345678').one().full_name = 'Jane Smith'
+        db.session.commit()
+    assert client.get('/auth/dashboard').get_json()['name'] == 'Jane Smith'
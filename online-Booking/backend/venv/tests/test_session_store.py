@@ -0,0 +1,57 @@
+import time
+from app.session_store import MemorySessionStore
+from app.ttl_cache import Sweeper
+from conftest import FakeRedis, register_and_login
+
+
+def test_unchanged_session_is_not_written_back(make_app):
+    redis = FakeRedis()
+    client = make_app(SESSION_BACKEND='redis', SESSION_REDIS=redis).test_client()
+    assert register_and_login(client).status_code == 200
+    writes = redis.writes
+
+    for _ in range(3):
+        response = client.get('/auth/dashboard')
+        assert response.status_code == 200
+        assert 'Set-Cookie' not in response.headers
+    assert redis.writes == writes
+
+
+def test_unchanged_cookie_session_is_not_resent(make_app):
+    client = make_app(SESSION_BACKEND='cookie').test_client()
+    assert register_and_login(client).status_code == 200
+
+    response = client.get('/auth/dashboard')
+    assert response.status_code == 200
+    assert 'Set-Cookie' not in response.headers
+
+
+def test_logout_deletes_session_from_store_and_browser(make_app):
+    redis = FakeRedis()
+    client = make_app(SESSION_BACKEND='redis', SESSION_REDIS=redis).test_client()
+    assert register_and_login(client).status_code == 200
+    assert len(redis.data) == 1
+
+    response = client.post('/auth/logout')
+    assert response.status_code == 200
+    assert redis.data == {}
+    assert 'sessionId=;' in response.headers['Set-Cookie']
+    assert client.get('/auth/dashboard').get_json()['status'] == 'unauthenticated'
+
+
+def test_sweeper_expires_memory_sessions():
+    store = MemorySessionStore(max_entries=100)
+    store.set('expiring', {'user_id': '1'}, ttl=0.05)
+    store.set('live', {'user_id': '2'}, ttl=60)
+
+    sweeper = Sweeper(store, interval=0.01, batch_size=10).start()
+    try:
+        deadline = time.monotonic() + 2
+        while len(store.cache) > 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        sweeper.stop()
+
+    assert len(store.cache) == 1
+    assert store.get('expiring') is None
+    assert store.get('live') == {'user_id': '2'}
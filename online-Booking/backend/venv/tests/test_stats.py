@@ -0,0 +1,42 @@
+from datetime import datetime
+from sqlalchemy import delete
+from app.models import db, QuoRegister, StatCounter, User
+from app.stats import read_stats, rebuild_stats
+
+
+def test_rebuild_puts_missing_parishes_in_one_bucket(make_app):
+    app = make_app()
+    with app.app_context():
+        User.create_user('1', 'No Parish', 'none@example.com', 'Secret@123')
+        User.create_user('2', 'Empty Parish', 'empty@example.com', 'Secret@123', parish='')
+        User.create_user('3', 'NA Parish', 'na@example.com', 'Secret@123', parish='N/A')
+        User.create_user('4', 'Parishioner', 'paul@example.com', 'Secret@123', parish='St. Paul')
+        incremental = read_stats()
+
+        rebuild_stats()
+        rebuilt = read_stats()
+
+    assert rebuilt['usersByParish'] == {'N/A': 3, 'St. Paul': 1}
+    assert rebuilt == incremental
+
+
+def test_sqlite_profile_seeds_counters_from_existing_rows(make_app):
+    app = make_app()
+    with app.app_context():
+        db.session.add_all(
+            QuoRegister(full_name=f'User {i}', email=f'user{i}@example.com', phone_number='0700000000',
+                        registration_date=datetime.utcnow())
+            for i in range(2)
+        )
+        db.session.execute(delete(StatCounter))  # As if the rows predate the counters
+        db.session.commit()
+
+    client = make_app().test_client()
+    with client.session_transaction() as session:
+        session['admin_id'] = 1
+    assert client.get('/api/user-stats').get_json()['totalRegistrations'] == 2
+
+    assert client.delete('/admin/users/1').status_code == 200
+    stats = client.get('/api/user-stats').get_json()
+    assert stats['totalRegistrations'] == 1
+    assert list(stats['registrationsByDay'].values()) == [1]